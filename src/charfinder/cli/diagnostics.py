@@ -21,8 +21,6 @@ import os
 from argparse import Namespace
 from typing import Any
 
-from dotenv import dotenv_values
-
 from charfinder.cli.diagnostics_match import print_match_diagnostics
 from charfinder.constants import ENV_DEBUG_ENV_LOAD
 from charfinder.settings import resolve_dotenv_path
@@ -187,6 +185,9 @@ def print_dotenv_debug(*, use_color: bool = False, show: bool = True) -> None:
         log_method="debug",
     )
 
+    # Imported here so only --debug runs pay for python-dotenv.
+    from dotenv import dotenv_values
+
     try:
         values = dotenv_values(dotenv_path=dotenv_path)
 
@@ -1,6 +1,6 @@
 """Handlers for CLI output rendering and execution in CharFinder.
 
-Delegates color formatting to `cli/formatter.py` and avoids using print().
+Delegates color formatting to `utils/formatter.py` and avoids using print().
 
 Functions:
     resolve_effective_threshold(): Resolve threshold from CLI arg, env var, or default.
@@ -37,7 +37,12 @@ from charfinder.constants import (
     EXIT_SUCCESS,
 )
 from charfinder.core.core_main import find_chars_raw, find_chars_with_info
-from charfinder.utils.formatter import echo, format_result_line, should_use_color
+from charfinder.utils.formatter import (
+    echo,
+    echo_lines,
+    format_result_line,
+    should_use_color,
+)
 from charfinder.utils.logger_setup import get_logger
 from charfinder.utils.logger_styles import format_error, format_warning
 
@@ -169,9 +174,12 @@ def print_result_lines(lines: list[str], *, use_color: bool = False) -> None:
         lines (list[str]): The list of result lines to print.
         use_color (bool, optional): Whether to apply color formatting. Defaults to False.
     """
-    for line in lines:
-        output = format_result_line(line, use_color=use_color)
-        sys.stdout.write(output + "\n")
+    echo_lines(
+        lines,
+        style=lambda line: format_result_line(line, use_color=use_color),
+        stream=sys.stdout,
+        log=False,
+    )
 
 
 # ---------------------------------------------------------------------
@@ -19,7 +19,7 @@ Defines:
 
 from pathlib import Path
 from types import SimpleNamespace
-from typing import Literal
+from typing import Literal, get_args
 
 # ---------------------------------------------------------------------
 # Typing Aliases
@@ -55,7 +55,13 @@ DEFAULT_ENCODING = "utf-8"
 
 VALID_FUZZY_MATCH_MODES = ("single", "hybrid")
 VALID_EXACT_MATCH_MODES = ("substring", "word-subset")
-VALID_LOG_METHODS = {"debug", "info", "warning", "error", "exception"}
+VALID_LOG_METHODS = frozenset({"debug", "info", "warning", "error", "exception"})
+
+# Frozen lookup sets for per-query validation. The tuples above keep their
+# order for CLI choices and error messages.
+VALID_FUZZY_MATCH_MODE_SET = frozenset(VALID_FUZZY_MATCH_MODES)
+VALID_EXACT_MATCH_MODE_SET = frozenset(VALID_EXACT_MATCH_MODES)
+VALID_HYBRID_AGG_FUNC_SET = frozenset(get_args(VALID_HYBRID_AGG_FUNCS))
 
 LOG_METHODS = SimpleNamespace(
     DEBUG="debug",
@@ -134,6 +140,7 @@ ENV_LOG_MAX_BYTES = "CHARFINDER_LOG_MAX_BYTES"
 ENV_LOG_BACKUP_COUNT = "CHARFINDER_LOG_BACKUP_COUNT"
 ENV_LOG_LEVEL = "CHARFINDER_LOG_LEVEL"
 ENV_DEBUG_ENV_LOAD = "CHARFINDER_DEBUG_ENV_LOAD"
+ENV_FORCE_DOTENV = "CHARFINDER_FORCE_DOTENV"
 
 # ---------------------------------------------------------------------
 # __all__
@@ -150,6 +157,7 @@ __all__ = [
     "DEFAULT_THRESHOLD",
     "ENV_DEBUG_ENV_LOAD",
     "ENV_ENVIRONMENT",
+    "ENV_FORCE_DOTENV",
     "ENV_LOG_BACKUP_COUNT",
     "ENV_LOG_LEVEL",
     "ENV_LOG_MAX_BYTES",
@@ -164,8 +172,11 @@ __all__ = [
     "LOG_METHODS",
     "PACKAGE_NAME",
     "VALID_EXACT_MATCH_MODES",
+    "VALID_EXACT_MATCH_MODE_SET",
     "VALID_FUZZY_MATCH_MODES",
+    "VALID_FUZZY_MATCH_MODE_SET",
     "VALID_HYBRID_AGG_FUNCS",
+    "VALID_HYBRID_AGG_FUNC_SET",
     "VALID_LOG_METHODS",
     "ColorMode",
     "ExactMatchMode",
@@ -22,7 +22,7 @@ Functions:
 from __future__ import annotations
 
 from collections.abc import Generator
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING
 
 from charfinder.constants import (
     DEFAULT_EXACT_MATCH_MODE,
@@ -31,19 +31,17 @@ from charfinder.constants import (
     DEFAULT_HYBRID_AGG_FUNC,
     DEFAULT_THRESHOLD,
     VALID_HYBRID_AGG_FUNCS,
+    ExactMatchMode,
     FuzzyAlgorithm,
     MatchMode,
 )
 from charfinder.core.finders import find_chars as _find_chars_impl
+from charfinder.core.finders import find_chars_lines_with_info as _find_chars_lines_impl
 from charfinder.core.finders import find_chars_raw as _find_chars_raw_impl
-from charfinder.core.finders import find_chars_with_info as _find_chars_info_impl
 from charfinder.types import SearchConfig
-from charfinder.utils.formatter import format_result_header, format_result_row
 
 if TYPE_CHECKING:
-    from charfinder.types import CharMatch
-
-ExactMatchMode = Literal["substring", "word-subset"]
+    from charfinder.types import CharMatch, NameCache
 
 __all__ = ["find_chars", "find_chars_raw"]
 
@@ -56,7 +54,7 @@ def _build_config(
     *,
     fuzzy: bool,
     threshold: float,
-    name_cache: dict[str, dict[str, str]] | None,
+    name_cache: NameCache | None,
     verbose: bool,
     use_color: bool,
     fuzzy_algo: FuzzyAlgorithm,
@@ -89,7 +87,7 @@ def find_chars(
     *,
     fuzzy: bool = False,
     threshold: float = DEFAULT_THRESHOLD,
-    name_cache: dict[str, dict[str, str]] | None = None,
+    name_cache: NameCache | None = None,
     verbose: bool = True,
     use_color: bool = True,
     fuzzy_algo: FuzzyAlgorithm = DEFAULT_FUZZY_ALGO,
@@ -139,7 +137,7 @@ def find_chars_raw(
     *,
     fuzzy: bool = False,
     threshold: float = DEFAULT_THRESHOLD,
-    name_cache: dict[str, dict[str, str]] | None = None,
+    name_cache: NameCache | None = None,
     verbose: bool = True,
     use_color: bool = True,
     fuzzy_algo: FuzzyAlgorithm = DEFAULT_FUZZY_ALGO,
@@ -189,7 +187,7 @@ def find_chars_with_info(
     *,
     fuzzy: bool = False,
     threshold: float = DEFAULT_THRESHOLD,
-    name_cache: dict[str, dict[str, str]] | None = None,
+    name_cache: NameCache | None = None,
     verbose: bool = True,
     use_color: bool = True,
     fuzzy_algo: FuzzyAlgorithm = DEFAULT_FUZZY_ALGO,
@@ -201,7 +199,7 @@ def find_chars_with_info(
     """
     Search for Unicode characters and return both output lines and fuzzy usage flag.
 
-    This wraps `core.finders.find_chars_with_info()` and returns:
+    This wraps `core.finders.find_chars_lines_with_info()` and returns:
       - The formatted output lines.
       - A boolean indicating whether fuzzy matching was actually used.
 
@@ -209,7 +207,7 @@ def find_chars_with_info(
         query (str): Input query string.
         fuzzy (bool): Whether to enable fuzzy matching.
         threshold (float): Fuzzy match threshold.
-        name_cache (dict[str, dict[str, str]] | None): Optional prebuilt name cache.
+        name_cache (NameCache | None): Optional prebuilt name cache.
         verbose (bool): Whether to show progress messages.
         use_color (bool): Whether to enable ANSI color formatting.
         fuzzy_algo (FuzzyAlgorithm): Algorithm used for fuzzy scoring.
@@ -236,20 +234,4 @@ def find_chars_with_info(
         prefer_fuzzy=prefer_fuzzy,
     )
 
-    raw_matches, fuzzy_used = _find_chars_info_impl(query, config)
-
-    lines: list[str] = []
-    if raw_matches:
-        has_score = raw_matches and "score" in raw_matches[0]
-        has_score = bool(raw_matches) and "score" in raw_matches[0]
-        lines.extend(format_result_header(has_score=has_score))
-        lines.extend(
-            format_result_row(
-                code := int(match["code"][2:], 16),
-                match["char"],
-                match["name"].removesuffix(f"  (\\u{code:04x})"),
-                match.get("score"),
-            )
-            for match in raw_matches
-        )
-    return lines, fuzzy_used
+    return _find_chars_lines_impl(query, config)
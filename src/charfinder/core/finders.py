@@ -21,19 +21,35 @@ Function:
 
 from __future__ import annotations
 
-from collections.abc import Generator
-from typing import NamedTuple
-
-from charfinder.constants import VALID_FUZZY_MATCH_MODES
+from dataclasses import dataclass
+from itertools import chain
+from typing import TYPE_CHECKING, NamedTuple
+
+from charfinder.constants import (
+    VALID_EXACT_MATCH_MODE_SET,
+    VALID_FUZZY_MATCH_MODE_SET,
+    VALID_HYBRID_AGG_FUNC_SET,
+)
 from charfinder.core.matching import find_exact_matches, find_fuzzy_matches
 from charfinder.core.name_cache import build_name_cache
 from charfinder.fuzzymatchlib import resolve_algorithm_name
 from charfinder.types import CharMatch, FuzzyMatchContext, SearchConfig
-from charfinder.utils.formatter import echo, format_result_header, format_result_row
+from charfinder.utils.formatter import (
+    echo,
+    format_result_header,
+    format_result_rows,
+    result_row_formatter,
+)
 from charfinder.utils.logger_styles import format_info
 from charfinder.utils.normalizer import normalize
 
-__all__ = ["find_chars", "find_chars_raw", "find_chars_with_info"]
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterator
+
+    from charfinder.constants import FuzzyAlgorithm
+    from charfinder.types import NameCache
+
+__all__ = ["find_chars", "find_chars_lines_with_info", "find_chars_raw", "find_chars_with_info"]
 
 # ---------------------------------------------------------------------
 # Message Constants
@@ -42,6 +58,10 @@ __all__ = ["find_chars", "find_chars_raw", "find_chars_with_info"]
 MSG_QUERY_TYPE_ERROR = "Query must be a string."
 MSG_QUERY_EMPTY_ERROR = "Query string must not be empty."
 MSG_INVALID_MATCH_MODE = "Invalid fuzzy match mode: '{mode}'. Must be 'single' or 'hybrid'."
+MSG_INVALID_EXACT_MODE = "Invalid exact match mode: '{mode}'. Must be 'substring' or 'word-subset'."
+MSG_INVALID_AGG_FN = (
+    "Invalid aggregation function: '{agg_fn}'. Must be 'mean', 'median', 'max' or 'min'."
+)
 MSG_INVALID_ALGO = "Invalid fuzzy algorithm: {error}"
 MSG_MATCH_FOUND = "Found {n} match(es) for query: '{query}'"
 MSG_MATCH_NOT_FOUND = "No matches found for query: '{query}'"
@@ -61,23 +81,53 @@ class MatchTuple(NamedTuple):
     score: float | None
 
 
+@dataclass
+class _MatchStats:
+    """Running totals for a match stream, filled in as it is consumed."""
+
+    count: int = 0
+    fuzzy_used: bool = False
+
+
 # ---------------------------------------------------------------------
 # Internal Helpers
 # ---------------------------------------------------------------------
 
 
 def _validate_query(query: str, config: SearchConfig) -> None:
+    """Reject invalid input before any expensive work such as building the name cache."""
     if not isinstance(query, str):
         raise TypeError(MSG_QUERY_TYPE_ERROR)
 
     if not query.strip():
         raise ValueError(MSG_QUERY_EMPTY_ERROR)
 
-    if config.fuzzy_match_mode not in VALID_FUZZY_MATCH_MODES:
+    if config.fuzzy_match_mode not in VALID_FUZZY_MATCH_MODE_SET:
         raise ValueError(MSG_INVALID_MATCH_MODE.format(mode=config.fuzzy_match_mode))
 
+    if config.exact_match_mode not in VALID_EXACT_MATCH_MODE_SET:
+        raise ValueError(MSG_INVALID_EXACT_MODE.format(mode=config.exact_match_mode))
+
+    if (
+        config.fuzzy
+        and config.fuzzy_match_mode == "hybrid"
+        and config.agg_fn not in VALID_HYBRID_AGG_FUNC_SET
+    ):
+        raise ValueError(MSG_INVALID_AGG_FN.format(agg_fn=config.agg_fn))
+
+
+def _resolve_matches(
+    query: str,
+    config: SearchConfig,
+    stats: _MatchStats,
+) -> Iterator[MatchTuple]:
+    """
+    Validate the query eagerly and return a lazy stream of matches.
 
-def _resolve_matches(query: str, config: SearchConfig) -> tuple[list[MatchTuple], bool]:
+    Exact matches are yielded as they are discovered; the fuzzy pass only
+    runs once the exact stream is exhausted, and only if it is needed.
+    `stats` is updated in place as the stream is consumed.
+    """
     _validate_query(query, config)
 
     try:
@@ -91,19 +141,26 @@ def _resolve_matches(query: str, config: SearchConfig) -> tuple[list[MatchTuple]
     )
 
     norm_query = normalize(query)
-    exact_matches: list[MatchTuple] = [
-        MatchTuple(*tpl)
-        for tpl in find_exact_matches(norm_query, name_cache, config.exact_match_mode)
-    ]
-
-    fuzzy_matches: list[MatchTuple] = []
-    fuzzy_executed = False
+    return _stream_matches(query, norm_query, name_cache, resolved_algo, config, stats)
+
+
+def _stream_matches(  # noqa: PLR0913, PLR0917
+    query: str,
+    norm_query: str,
+    name_cache: NameCache,
+    resolved_algo: FuzzyAlgorithm,
+    config: SearchConfig,
+    stats: _MatchStats,
+) -> Generator[MatchTuple, None, None]:
+    exact_found = False
+    for tpl in find_exact_matches(norm_query, name_cache, config.exact_match_mode):
+        exact_found = True
+        stats.count += 1
+        yield MatchTuple(*tpl)
 
     # === Decides whether to run fuzzy matching
-    run_fuzzy = config.fuzzy and (config.prefer_fuzzy or not exact_matches)
-
-    if run_fuzzy:
-        fuzzy_executed = True
+    if config.fuzzy and (config.prefer_fuzzy or not exact_found):
+        stats.fuzzy_used = True
         context = FuzzyMatchContext(
             threshold=config.threshold,
             fuzzy_algo=resolved_algo,
@@ -113,11 +170,12 @@ def _resolve_matches(query: str, config: SearchConfig) -> tuple[list[MatchTuple]
             use_color=config.use_color,
             query=query,
         )
-        fuzzy_results = find_fuzzy_matches(norm_query, name_cache, context)
-        fuzzy_matches.extend(MatchTuple(*tpl) for tpl in fuzzy_results)
+        for tpl in find_fuzzy_matches(norm_query, name_cache, context):
+            stats.count += 1
+            yield MatchTuple(*tpl)
 
     # === Logging (INFO messages)
-    if config.verbose and exact_matches:
+    if config.verbose and exact_found:
         if config.fuzzy and not config.prefer_fuzzy:
             echo(
                 MSG_EXACT_SKIP_FUZZY,
@@ -135,12 +193,9 @@ def _resolve_matches(query: str, config: SearchConfig) -> tuple[list[MatchTuple]
                 log_method="info",
             )
 
-    # === Combine matches
-    all_matches = exact_matches + fuzzy_matches
-
     message = (
-        MSG_MATCH_FOUND.format(n=len(all_matches), query=query)
-        if all_matches
+        MSG_MATCH_FOUND.format(n=stats.count, query=query)
+        if stats.count
         else MSG_MATCH_NOT_FOUND.format(query=query)
     )
     echo(
@@ -151,7 +206,29 @@ def _resolve_matches(query: str, config: SearchConfig) -> tuple[list[MatchTuple]
         log_method="info",
     )
 
-    return all_matches, fuzzy_executed
+
+def _to_char_match(match: MatchTuple) -> CharMatch:
+    item: CharMatch = {
+        "code": f"U+{match.code:04X}",
+        "char": match.char,
+        "name": f"{match.name}  (\\u{match.code:04x})",
+    }
+    if match.score is not None:
+        item["score"] = round(match.score, 3)
+    return item
+
+
+def _format_lines(matches: Iterator[MatchTuple]) -> Generator[str, None, None]:
+    # Peek at the first match to decide on the header, then stream the rest.
+    first = next(matches, None)
+    if first is None:
+        return
+
+    has_score = first.score is not None
+    yield from format_result_header(has_score=has_score)
+    format_row = result_row_formatter(has_score=has_score)
+    for match in chain((first,), matches):
+        yield format_row(match.code, match.char, match.name, match.score)
 
 
 # ---------------------------------------------------------------------
@@ -170,13 +247,7 @@ def find_chars(query: str, config: SearchConfig) -> Generator[str, None, None]:
     Returns:
         Generator[str, None, None]: Formatted lines for CLI output.
     """
-    matches, _ = _resolve_matches(query, config)
-    if not matches:
-        return
-
-    yield from format_result_header(has_score=(matches[0].score is not None))
-    for match in matches:
-        yield format_result_row(match.code, match.char, match.name, match.score)
+    yield from _format_lines(_resolve_matches(query, config, _MatchStats()))
 
 
 def find_chars_raw(query: str, config: SearchConfig) -> list[CharMatch]:
@@ -190,20 +261,7 @@ def find_chars_raw(query: str, config: SearchConfig) -> list[CharMatch]:
     Returns:
         list[CharMatch]: List of Unicode character matches, formatted for JSON output.
     """
-    matches, _ = _resolve_matches(query, config)
-
-    results: list[CharMatch] = []
-    for match in matches:
-        item: CharMatch = {
-            "code": f"U+{match.code:04X}",
-            "char": match.char,
-            "name": f"{match.name}  (\\u{match.code:04x})",
-        }
-        if match.score is not None:
-            item["score"] = round(match.score, 3)
-        results.append(item)
-
-    return results
+    return [_to_char_match(match) for match in _resolve_matches(query, config, _MatchStats())]
 
 
 def find_chars_with_info(query: str, config: SearchConfig) -> tuple[list[CharMatch], bool]:
@@ -223,17 +281,32 @@ def find_chars_with_info(query: str, config: SearchConfig) -> tuple[list[CharMat
             - List of match records (CharMatch) formatted for JSON output.
             - A boolean indicating whether fuzzy matching was used.
     """
-    matches, used_fuzzy = _resolve_matches(query, config)
-
-    results: list[CharMatch] = []
-    for match in matches:
-        item: CharMatch = {
-            "code": f"U+{match.code:04X}",
-            "char": match.char,
-            "name": f"{match.name}  (\\u{match.code:04x})",
-        }
-        if match.score is not None:
-            item["score"] = round(match.score, 3)
-        results.append(item)
-
-    return results, used_fuzzy
+    stats = _MatchStats()
+    results = [_to_char_match(match) for match in _resolve_matches(query, config, stats)]
+    return results, stats.fuzzy_used
+
+
+def find_chars_lines_with_info(query: str, config: SearchConfig) -> tuple[list[str], bool]:
+    """
+    Search for Unicode characters and return formatted output lines with fuzzy usage flag.
+
+    Rows are formatted straight from the match tuples, without a round-trip
+    through the JSON-oriented CharMatch records.
+
+    Args:
+        query (str): Input query string.
+        config (SearchConfig): Configuration options controlling matching behavior.
+
+    Returns:
+        tuple[list[str], bool]: A tuple containing:
+            - A list of formatted CLI output lines.
+            - A boolean indicating whether fuzzy matching was used.
+    """
+    stats = _MatchStats()
+    # The whole table is materialized anyway, so format the rows in one batch.
+    matches = list(_resolve_matches(query, config, stats))
+    if not matches:
+        return [], stats.fuzzy_used
+    lines = format_result_rows(matches)
+    lines[:0] = format_result_header(has_score=matches[0].score is not None)
+    return lines, stats.fuzzy_used
@@ -12,11 +12,36 @@ Functions:
 # Imports
 # ---------------------------------------------------------------------
 
-from charfinder.fuzzymatchlib import compute_similarity
-from charfinder.types import FuzzyMatchContext
+from __future__ import annotations
+
+import logging
+from bisect import bisect_left
+from typing import TYPE_CHECKING
+
+from rapidfuzz import process
+from rapidfuzz.distance import Indel
+
+from charfinder.core.name_cache import (
+    get_alternate_rows,
+    get_corpus,
+    get_length_rows,
+    get_word_sets,
+)
+from charfinder.fuzzymatchlib import (
+    BULK_ALGORITHMS,
+    LENGTH_BOUNDED_ALGORITHMS,
+    compute_similarity_bulk,
+    prepare_similarity,
+)
 from charfinder.utils.formatter import echo
 from charfinder.utils.logger_setup import get_logger
-from charfinder.utils.logger_styles import format_debug, format_info
+from charfinder.utils.logger_styles import format_info
+
+if TYPE_CHECKING:
+    from array import array
+    from collections.abc import Callable, Generator, Iterable, Iterator
+
+    from charfinder.types import FuzzyMatchContext, MatchRow, NameCache
 
 __all__ = [
     "find_exact_matches",
@@ -25,6 +50,69 @@ __all__ = [
 
 logger = get_logger()
 
+# Single-mode algorithms without a native bulk scorer, mapped to a RapidFuzz
+# scorer (on a 0-1 scale) that bounds them from above. SequenceMatcher's
+# matching blocks form a common subsequence, so its ratio never exceeds the
+# normalized Indel (LCS) similarity; only rows reaching the threshold under
+# the bound are scored exactly.
+_UPPER_BOUND_SCORERS: dict[str, Callable[..., float]] = {
+    "sequencematcher": Indel.normalized_similarity,
+}
+
+# Threads used by bulk fuzzy scoring (-1 for one per core). RapidFuzz only
+# parallelizes when NumPy is installed; otherwise scoring is single-threaded.
+FUZZY_WORKERS = -1
+
+# Largest share of the cache that length-bounded scoring gathers from the
+# length buckets; wider windows scan every row instead.
+LENGTH_BUCKET_MAX_SHARE = 0.25
+
+# Number of fuzzy result lists memoized per name cache (least recently used
+# entries are evicted first).
+FUZZY_MEMO_SIZE = 128
+
+# Slack subtracted from the native score cutoff so float rounding never drops a
+# row that reaches the threshold; the exact comparison is redone afterwards.
+_CUTOFF_EPSILON = 1e-9
+
+# ---------------------------------------------------------------------
+# Word Index
+# ---------------------------------------------------------------------
+
+
+def _postings(name_cache: NameCache, word: str) -> array[int]:
+    """Return the rows (in cache order) whose names contain `word` as a whole word."""
+    words = name_cache.index_words
+    pos = bisect_left(words, word)
+    if pos == len(words) or words[pos] != word:
+        return name_cache.index_postings[:0]
+    offsets = name_cache.index_offsets
+    return name_cache.index_postings[offsets[pos] : offsets[pos + 1]]
+
+
+def _rows_with_all_words(name_cache: NameCache, words: Iterable[str]) -> list[int]:
+    """Intersect the posting lists of `words`, starting from the rarest one."""
+    postings = sorted((_postings(name_cache, word) for word in words), key=len)
+    rows = set(postings[0])
+    for other in postings[1:]:
+        if not rows:
+            break
+        rows.intersection_update(other)
+    return sorted(rows)
+
+
+def _interior_words(norm_query: str) -> set[str]:
+    """
+    Return the query words that a substring match must contain as whole words.
+
+    A word with a space on both sides in the query can only occur inside a
+    matching name as a complete word, whereas the first and last pieces may
+    be fragments of longer words.
+    """
+    pieces = norm_query.split(" ")[1:-1]
+    return {piece for piece in pieces if piece and piece.split() == [piece]}
+
+
 # ---------------------------------------------------------------------
 # Exact Matching
 # ---------------------------------------------------------------------
@@ -32,46 +120,136 @@ logger = get_logger()
 
 def find_exact_matches(
     norm_query: str,
-    name_cache: dict[str, dict[str, str]],
+    name_cache: NameCache,
     exact_match_mode: str,
-) -> list[tuple[int, str, str, float | None]]:
+) -> Generator[tuple[int, str, str, float | None], None, None]:
     """
     Perform exact matching based on the chosen exact match mode,
     using both official and alternate normalized names.
 
+    Matches are yielded lazily, in cache order, as they are discovered.
+
     Args:
         norm_query (str): Normalized query.
-        name_cache (dict[str, dict[str, str]]): Unicode name cache.
+        name_cache (NameCache): Unicode name cache.
         exact_match_mode (str): Exact match mode to use ('substring' or 'word-subset').
 
-    Returns:
-        list[tuple[int, str, str, float | None]]:
-            List of matches as (code point, character, name, None).
+    Yields:
+        tuple[int, str, str, float | None]: Matches as (code point, character, name, None).
     """
+    if exact_match_mode == "word-subset":
+        yield from _find_word_subset_matches(norm_query, name_cache)
+        return
+    if exact_match_mode != "substring":
+        message = f"Unknown exact match mode: {exact_match_mode}"
+        raise ValueError(message)
+
+    # Prefilter: whole words inside the query narrow the scan to the rows
+    # that contain all of them; the substring test still decides each row.
+    interior_words = _interior_words(norm_query) if name_cache.index_words else set()
+    if interior_words:
+        code_points = name_cache.code_points
+        names = name_cache.names
+        normalized = name_cache.normalized
+        alt_normalized = name_cache.alt_normalized
+        for idx in _rows_with_all_words(name_cache, interior_words):
+            if norm_query in normalized[idx] or norm_query in alt_normalized[idx]:
+                code_point = code_points[idx]
+                yield (code_point, chr(code_point), names[idx], None)
+        return
+
+    if norm_query and "\n" not in norm_query:
+        yield from _find_substring_matches_in_corpus(norm_query, name_cache)
+        return
 
-    matches: list[tuple[int, str, str, float | None]] = []
     # Matching Loop
-    for char, names in name_cache.items():
-        code_point = ord(char)
-        original_name = names["original"]
-        norm_name = names["normalized"]
-        alt_norm = names.get("alternate_normalized")
-
-        if exact_match_mode == "substring":
-            if norm_query in norm_name or (alt_norm and norm_query in alt_norm):
-                matches.append((code_point, char, original_name, None))
-        elif exact_match_mode == "word-subset":
-            query_words = set(norm_query.split())
-            name_words = set(norm_name.split())
-            if alt_norm:
-                name_words |= set(alt_norm.split())
-            if query_words <= name_words:
-                matches.append((code_point, char, original_name, None))
-        else:
-            message = f"Unknown exact match mode: {exact_match_mode}"
-            raise ValueError(message)
-
-    return matches
+    for code_point, original_name, norm_name, alt_norm in zip(
+        name_cache.code_points,
+        name_cache.names,
+        name_cache.normalized,
+        name_cache.alt_normalized,
+        strict=True,
+    ):
+        # An empty alternate never contains the (non-empty) query.
+        if norm_query in norm_name or norm_query in alt_norm:
+            yield (code_point, chr(code_point), original_name, None)
+
+
+def _find_substring_matches_in_corpus(
+    norm_query: str, name_cache: NameCache
+) -> Generator[MatchRow, None, None]:
+    """
+    Yield the rows whose names contain `norm_query`, via `str.find` on the joined corpus.
+
+    The search runs in C across the whole cache; Python only steps in per
+    hit, to count the newlines since the previous hit (giving the row) and
+    to resume the search at the next row. `norm_query` must be non-empty and
+    free of newlines, so that a hit never spans two names.
+    """
+    corpus = get_corpus(name_cache)
+    find = corpus.find
+    count = corpus.count
+    code_points = name_cache.code_points
+    names = name_cache.names
+
+    # `line` is the line number at offset `start`.
+    line = start = 0
+    pos = find(norm_query)
+    while pos >= 0:
+        line += count("\n", start, pos)
+        idx = line >> 1
+        code_point = code_points[idx]
+        yield (code_point, chr(code_point), names[idx], None)
+
+        # Skip the rest of the row: one line if the hit was in the
+        # alternate name, two if it was in the official name.
+        start = find("\n", pos)
+        if not line & 1 and start >= 0:
+            start = find("\n", start + 1)
+        if start < 0:
+            return
+        start += 1
+        line = 2 * idx + 2
+        pos = find(norm_query, start)
+
+
+def _find_word_subset_matches(
+    norm_query: str,
+    name_cache: NameCache,
+) -> Generator[tuple[int, str, str, float | None], None, None]:
+    """Yield rows whose official or alternate names contain every query word."""
+    query_words = frozenset(norm_query.split())
+
+    # Fast path: when every query word has a bit in the cache's word masks,
+    # word-subset matching is a single integer AND per row.
+    if name_cache.word_masks:
+        word_bits = name_cache.word_bits
+        if all(word in word_bits for word in query_words):
+            query_mask = 0
+            for word in query_words:
+                query_mask |= word_bits[word]
+            for code_point, original_name, row_mask in zip(
+                name_cache.code_points, name_cache.names, name_cache.word_masks, strict=True
+            ):
+                if row_mask & query_mask == query_mask:
+                    yield (code_point, chr(code_point), original_name, None)
+            return
+
+    # Otherwise some query word is outside the masked vocabulary, so it is
+    # rare enough that intersecting posting lists beats a full scan.
+    if query_words and name_cache.index_words:
+        code_points = name_cache.code_points
+        names = name_cache.names
+        for idx in _rows_with_all_words(name_cache, query_words):
+            code_point = code_points[idx]
+            yield (code_point, chr(code_point), names[idx], None)
+        return
+
+    for code_point, original_name, row_words in zip(
+        name_cache.code_points, name_cache.names, get_word_sets(name_cache), strict=True
+    ):
+        if query_words <= row_words:
+            yield (code_point, chr(code_point), original_name, None)
 
 
 # ---------------------------------------------------------------------
@@ -79,24 +257,207 @@ def find_exact_matches(
 # ---------------------------------------------------------------------
 
 
+def _find_fuzzy_matches_bulk(
+    norm_query: str,
+    name_cache: NameCache,
+    context: FuzzyMatchContext,
+) -> Generator[MatchRow, None, None]:
+    """Score all names in one bulk call per column, pruning below the threshold."""
+    threshold = context.threshold
+
+    def score_column(candidates: list[str]) -> dict[int, float]:
+        return compute_similarity_bulk(
+            norm_query,
+            candidates,
+            context.fuzzy_algo,
+            context.match_mode,
+            context.agg_fn,
+            score_cutoff=threshold,
+            prepared=True,
+            workers=FUZZY_WORKERS,
+        )
+
+    # Best score per row across official and alternate names. Alternates are
+    # scored from the compact list of rows that have one.
+    alt_rows, alt_names = get_alternate_rows(name_cache)
+    scores = {
+        idx: score for idx, score in score_column(name_cache.normalized).items() if score > 0.0
+    }
+    for pos, score in score_column(alt_names).items():
+        idx = alt_rows[pos]
+        if score > scores.get(idx, 0.0):
+            scores[idx] = score
+
+    code_points = name_cache.code_points
+    names = name_cache.names
+    for idx in sorted(scores):
+        score = scores[idx]
+        if score >= threshold:
+            code_point = code_points[idx]
+            yield (code_point, chr(code_point), names[idx], score)
+
+
+def _length_window(norm_query: str, context: FuzzyMatchContext) -> tuple[float, float]:
+    """
+    Return the name lengths that can still reach the threshold.
+
+    Only length-bounded algorithms are restricted; cached names are already
+    stripped and uppercased, so their lengths are the ones the scorer sees.
+    """
+    threshold = context.threshold
+    if (
+        context.match_mode != "single"
+        or context.fuzzy_algo not in LENGTH_BOUNDED_ALGORITHMS
+        or threshold <= 0.0
+    ):
+        return 0.0, float("inf")
+
+    query_len = len(norm_query.strip().upper())
+    return (
+        query_len * threshold / (2.0 - threshold) - _CUTOFF_EPSILON,
+        query_len * (2.0 - threshold) / threshold + _CUTOFF_EPSILON,
+    )
+
+
+def _find_fuzzy_matches_bounded(
+    norm_query: str,
+    name_cache: NameCache,
+    context: FuzzyMatchContext,
+    upper_bound: Callable[..., float],
+) -> Generator[MatchRow, None, None]:
+    """Score exactly only the names whose bulk upper bound reaches the threshold."""
+    query = norm_query.strip().upper()
+    cutoff = max(context.threshold - _CUTOFF_EPSILON, 0.0)
+
+    name_hits = {
+        idx
+        for _, _, idx in process.extract(
+            query, name_cache.normalized, scorer=upper_bound, limit=None, score_cutoff=cutoff
+        )
+    }
+    alt_rows, alt_names = get_alternate_rows(name_cache)
+    alt_hits = {
+        alt_rows[pos]: alt_names[pos]
+        for _, _, pos in process.extract(
+            query, alt_names, scorer=upper_bound, limit=None, score_cutoff=cutoff
+        )
+    }
+
+    # A name that misses the bound scores below the threshold, so leaving it
+    # out of the max never changes which rows match or their scores.
+    score_candidate = prepare_similarity(
+        norm_query, context.fuzzy_algo, context.match_mode, agg_fn=context.agg_fn, prepared=True
+    )
+    code_points = name_cache.code_points
+    names = name_cache.names
+    normalized = name_cache.normalized
+    for idx in sorted(name_hits.union(alt_hits)):
+        score1 = score_candidate(normalized[idx]) if idx in name_hits else None
+        alt_norm = alt_hits.get(idx)
+        score2 = score_candidate(alt_norm) if alt_norm else None
+        score = max(filter(None, [score1, score2]), default=None)
+        if score is not None and score >= context.threshold:
+            code_point = code_points[idx]
+            yield (code_point, chr(code_point), names[idx], score)
+
+
+def _rows_in_length_window(
+    name_cache: NameCache, min_len: float, max_len: float
+) -> Iterator[tuple[int, str, str, str]]:
+    """
+    Yield `(code point, name, normalized, alternate)` for rows that may fall in the window.
+
+    A narrow window only visits the length buckets inside it; rows are
+    still yielded in cache order. Wide windows fall back to a plain scan,
+    which is cheaper than merging buckets covering most of the cache.
+    """
+    columns = (
+        name_cache.code_points,
+        name_cache.names,
+        name_cache.normalized,
+        name_cache.alt_normalized,
+    )
+    if max_len == float("inf"):
+        return zip(*columns, strict=True)
+
+    buckets = [
+        bucket
+        for length, bucket in get_length_rows(name_cache).items()
+        if min_len <= length <= max_len
+    ]
+    if sum(map(len, buckets)) > len(name_cache) * LENGTH_BUCKET_MAX_SHARE:
+        return zip(*columns, strict=True)
+
+    code_points, names, normalized, alt_normalized = columns
+    rows = sorted({idx for bucket in buckets for idx in bucket})
+    return ((code_points[i], names[i], normalized[i], alt_normalized[i]) for i in rows)
+
+
+def _find_fuzzy_matches_per_pair(
+    norm_query: str,
+    name_cache: NameCache,
+    context: FuzzyMatchContext,
+) -> Generator[MatchRow, None, None]:
+    """Score each name with a prepared scorer, skipping rows outside the length window."""
+    # Per-char skip messages are folded into one summary line, and only
+    # counted at all when a debug sink is listening.
+    debug_on = context.verbose and logger.isEnabledFor(logging.DEBUG)
+    skipped_count = 0
+
+    min_len, max_len = _length_window(norm_query, context)
+    score_candidate = prepare_similarity(
+        norm_query,
+        context.fuzzy_algo,
+        context.match_mode,
+        agg_fn=context.agg_fn,
+        score_cutoff=context.threshold,
+        prepared=True,
+    )
+
+    for code_point, original_name, norm_name, alt_norm in _rows_in_length_window(
+        name_cache, min_len, max_len
+    ):
+        if not min_len <= len(norm_name) <= max_len and not (
+            alt_norm and min_len <= len(alt_norm) <= max_len
+        ):
+            continue
+
+        score1 = score_candidate(norm_name)
+        score2 = score_candidate(alt_norm) if alt_norm else None
+        score = max(filter(None, [score1, score2]), default=None)
+
+        if score is None:
+            if debug_on:
+                skipped_count += 1
+            continue
+
+        if score >= context.threshold:
+            yield (code_point, chr(code_point), original_name, score)
+
+    if skipped_count:
+        logger.debug("Skipped %d chars (no valid score computed).", skipped_count)
+
+
 def find_fuzzy_matches(
     norm_query: str,
-    name_cache: dict[str, dict[str, str]],
+    name_cache: NameCache,
     context: FuzzyMatchContext,
-) -> list[tuple[int, str, str, float | None]]:
+) -> Generator[tuple[int, str, str, float | None], None, None]:
     """
     Perform fuzzy matching using normalized and alternate normalized names.
 
+    Matches are yielded lazily, in cache order, as they are scored. Fully
+    consumed result lists are memoized on the name cache, so repeating a
+    query with the same scoring parameters replays them without rescoring.
+
     Args:
         norm_query: Normalized query.
         name_cache: Unicode name cache.
         context: FuzzyMatchContext instance.
 
-    Returns:
-        list[tuple[int, str, str, float]]: List of matches as (code point, character, name, score).
+    Yields:
+        tuple[int, str, str, float]: Matches as (code point, character, name, score).
     """
-    matches: list[tuple[int, str, str, float | None]] = []
-
     if context.verbose:
         message = f"No exact match found for '{context.query}', "
         echo(
@@ -118,43 +479,35 @@ def find_fuzzy_matches(
             log_method="info",
         )
 
-    for char, names in name_cache.items():
-        norm_name = names["normalized"]
-        alt_norm = names.get("alternate_normalized")
-
-        score1 = compute_similarity(
-            norm_query,
-            norm_name,
-            context.fuzzy_algo,
-            context.match_mode,
-            agg_fn=context.agg_fn,
-        )
-        score2 = (
-            compute_similarity(
-                norm_query,
-                alt_norm,
-                context.fuzzy_algo,
-                context.match_mode,
-                agg_fn=context.agg_fn,
-            )
-            if alt_norm
-            else None
-        )
-        score = max(filter(None, [score1, score2]), default=None)
+    key = (
+        norm_query,
+        context.threshold,
+        context.fuzzy_algo,
+        context.match_mode,
+        context.agg_fn,
+    )
+    memo = name_cache.fuzzy_memo
+    cached = memo.get(key)
+    if cached is not None:
+        memo.move_to_end(key)
+        yield from cached
+        return
 
-        if score is None:
-            if context.verbose:
-                message = f"Skipped char '{char}' (no valid score computed)."
-                echo(
-                    message,
-                    style=lambda m: format_debug(m, use_color=context.use_color),
-                    show=True,
-                    log=True,
-                    log_method="debug",
-                )
-            continue
+    single = context.match_mode == "single"
+    upper_bound = _UPPER_BOUND_SCORERS.get(context.fuzzy_algo) if single else None
+    matches: Iterable[MatchRow]
+    if single and context.fuzzy_algo in BULK_ALGORITHMS:
+        matches = _find_fuzzy_matches_bulk(norm_query, name_cache, context)
+    elif upper_bound is not None:
+        matches = _find_fuzzy_matches_bounded(norm_query, name_cache, context, upper_bound)
+    else:
+        matches = _find_fuzzy_matches_per_pair(norm_query, name_cache, context)
 
-        if score >= context.threshold:
-            matches.append((ord(char), char, names["original"], score))
+    results: list[MatchRow] = []
+    for match in matches:
+        results.append(match)
+        yield match
 
-    return matches
+    memo[key] = results
+    if len(memo) > FUZZY_MEMO_SIZE:
+        memo.popitem(last=False)
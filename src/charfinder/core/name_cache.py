@@ -1,7 +1,9 @@
 """Name cache builder for CharFinder.
 
 Provides functionality to build and cache Unicode character names,
-including alternate names from UnicodeData.txt.
+reading official and alternate names from UnicodeData.txt when it is
+available and matches the running Unicode database, and falling back to
+`unicodedata` otherwise.
 
 This module is intentionally separated from CLI logic to support clean reuse
 in both library and CLI contexts.
@@ -14,41 +16,459 @@ Functions:
 # Imports
 # ---------------------------------------------------------------------
 
-import json
+from __future__ import annotations
+
+import functools
+import multiprocessing
+import os
+import pickle
 import sys
 import unicodedata
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from importlib.resources import files
+from itertools import chain
 from pathlib import Path
-from typing import cast
+from typing import TYPE_CHECKING
 
-from charfinder.core.unicode_data_loader import load_alternate_names
+from charfinder.core.unicode_data_loader import load_unicode_names
 from charfinder.settings import get_cache_file
+from charfinder.types import NameCache
 from charfinder.utils.formatter import echo
 from charfinder.utils.logger_setup import get_logger
-from charfinder.utils.logger_styles import format_error, format_info
+from charfinder.utils.logger_styles import format_error, format_info, format_warning
 from charfinder.utils.normalizer import normalize
 
+if TYPE_CHECKING:
+    from importlib.resources.abc import Traversable
+
 __all__ = [
     "build_name_cache",
+    "get_alternate_rows",
+    "get_corpus",
+    "get_length_rows",
+    "get_word_sets",
 ]
 
 logger = get_logger()
 
+# Bump whenever the on-disk payload layout changes; older files are rebuilt.
+CACHE_FORMAT_VERSION = 6
+
+# Contiguous code point chunks handed to each build worker; several per worker
+# keeps the pool busy since names cluster in the lower planes.
+BUILD_CHUNKS_PER_WORKER = 4
+
+# Number of most frequent name words that get a bit in the per-row word masks
+# (one unsigned 64-bit array item per row).
+WORD_MASK_BITS = 64
+
+# String columns are persisted packed: one contiguous string per column with
+# rows separated by a character that never occurs in a Unicode name.
+PACKED_SEPARATOR = "\n"
+
+# Code point ranges `[start, stop)` that can hold named characters. The gaps
+# are surrogates and the BMP private use area (D800-F8FF), the unassigned
+# planes 4-13, and everything after the variation selectors supplement
+# (E01F0-10FFFF: unassigned plus the private use planes 15-16). Skipping
+# them avoids roughly 70% of the `unicodedata.name()` calls.
+NAMED_CODE_POINT_RANGES: tuple[tuple[int, int], ...] = (
+    (0x0000, 0xD800),
+    (0xF900, 0x40000),
+    (0xE0000, 0xE01F0),
+)
+
+# Planes whose highest named character must be the same in UnicodeData.txt
+# and `unicodedata` for the file's names to be used; new characters are
+# assigned in these planes.
+VERSION_CHECK_PLANES = (0, 1, 2, 3)
+PLANE_SIZE = 0x10000
+
+# Precomputed cache shipped inside the package (generated at release time with
+# `make build-name-cache`); used when no user-level cache file exists yet.
+BUNDLED_CACHE_FILE_NAME = "unicode_name_cache.pkl"
+
+# In-process memo of caches already loaded or built, keyed by cache file path,
+# so repeated searches in the same process deserialize the cache only once.
+_CACHE: dict[Path, NameCache] = {}
+
+# ---------------------------------------------------------------------
+# Internal Helpers
+# ---------------------------------------------------------------------
+
+
+def _normalize_shared(text: str) -> str:
+    """
+    Normalize `text`, reusing the input object when normalization leaves it unchanged.
+
+    Unicode names are already NFC upper-case ASCII, so the name and normalized
+    columns end up sharing one string object per row, in memory and in the
+    pickled cache (pickle stores a repeated object only once).
+    """
+    normalized = normalize(text)
+    return text if normalized == text else normalized
+
+
+def _scan_code_points(bounds: tuple[int, int]) -> tuple[list[int], list[str], list[str]]:
+    """Collect named code points in `[start, stop)` with their normalized names."""
+    start, stop = bounds
+    code_points: list[int] = []
+    names: list[str] = []
+    normalized: list[str] = []
+    for code in range(start, stop):
+        name = unicodedata.name(chr(code), "")
+        if name:
+            code_points.append(code)
+            names.append(name)
+            normalized.append(_normalize_shared(name))
+    return code_points, names, normalized
+
+
+@functools.cache
+def _runtime_plane_tops() -> tuple[int | None, ...]:
+    """Return the highest code point `unicodedata` names in each of VERSION_CHECK_PLANES."""
+    name = unicodedata.name
+    tops: list[int | None] = []
+    for plane in VERSION_CHECK_PLANES:
+        start = plane * PLANE_SIZE
+        codes = range(start + PLANE_SIZE - 1, start - 1, -1)
+        tops.append(next((code for code in codes if name(chr(code), "")), None))
+    return tuple(tops)
+
+
+def _names_match_runtime(official_names: dict[str, str]) -> bool:
+    """
+    Return whether names parsed from UnicodeData.txt match the running Unicode database.
+
+    The cache is stamped with `unicodedata.unidata_version`, so its names must
+    come from that version. Comparing every name would cost as much as the
+    scan the file replaces, so only sentinels are checked: in each of
+    VERSION_CHECK_PLANES, the file and `unicodedata` must agree on the highest
+    named code point and on its name. Rows are in code point order, so each
+    plane's highest row is found by bisection.
+    """
+    chars = list(official_names)
+    for plane, runtime_top in zip(VERSION_CHECK_PLANES, _runtime_plane_tops(), strict=True):
+        pos = bisect_left(chars, chr((plane + 1) * PLANE_SIZE))
+        top_char = chars[pos - 1] if pos else None
+        if top_char is None or ord(top_char) < plane * PLANE_SIZE:
+            if runtime_top is not None:
+                return False
+            continue
+        if ord(top_char) != runtime_top:
+            return False
+        if unicodedata.name(top_char, "") != official_names[top_char]:
+            return False
+    return True
+
+
+def _scan_all_code_points(workers: int) -> list[tuple[list[int], list[str], list[str]]]:
+    """
+    Scan the named code point ranges, in parallel when more than one worker is available.
+
+    Chunks are returned in code point order. Falls back to a serial scan if
+    worker processes cannot be started.
+    """
+    if workers > 1:
+        total = sum(stop - start for start, stop in NAMED_CODE_POINT_RANGES)
+        step = -(-total // (workers * BUILD_CHUNKS_PER_WORKER))
+        chunks = [
+            (chunk_start, min(chunk_start + step, stop))
+            for start, stop in NAMED_CODE_POINT_RANGES
+            for chunk_start in range(start, stop, step)
+        ]
+        try:
+            with multiprocessing.Pool(workers) as pool:
+                return pool.map(_scan_code_points, chunks, chunksize=1)
+        except OSError:
+            logger.warning("Could not start build workers; scanning code points serially.")
+    return [_scan_code_points(bounds) for bounds in NAMED_CODE_POINT_RANGES]
+
+
+def _build_word_masks(cache: NameCache) -> None:
+    """Assign bits to the most frequent name words and compute each row's word mask."""
+    row_words = get_word_sets(cache)
+    counts = Counter(word for words in row_words for word in words)
+    cache.word_bits = {
+        word: 1 << bit for bit, (word, _) in enumerate(counts.most_common(WORD_MASK_BITS))
+    }
+
+    word_bits = cache.word_bits
+    masks = array("Q")
+    for words in row_words:
+        mask = 0
+        for word in words:
+            mask |= word_bits.get(word, 0)
+        masks.append(mask)
+    cache.word_masks = masks
+
+
+def _build_word_index(cache: NameCache) -> None:
+    """Build the inverted index from each name word to the rows that contain it."""
+    rows_by_word: dict[str, list[int]] = {}
+    for idx, words in enumerate(get_word_sets(cache)):
+        for word in words:
+            rows_by_word.setdefault(word, []).append(idx)
+
+    cache.index_words = sorted(rows_by_word)
+    offsets = array("I", [0])
+    postings = array("I")
+    for word in cache.index_words:
+        postings.extend(rows_by_word[word])
+        offsets.append(len(postings))
+    cache.index_offsets = offsets
+    cache.index_postings = postings
+
+
+def _pack(column: list[str]) -> str:
+    """Join a string column into one contiguous string."""
+    return PACKED_SEPARATOR.join(column)
+
+
+def _unpack(packed: str, count: int) -> list[str]:
+    """Split a packed string column back into its `count` rows."""
+    return packed.split(PACKED_SEPARATOR) if count else []
+
+
+def _cache_from_payload(data: object) -> NameCache | None:
+    """
+    Convert an on-disk payload into a NameCache.
+
+    Returns None if the payload is not in the current columnar format
+    (e.g. a legacy dict-of-dicts cache) or was built against a different
+    Unicode database version, so the caller can rebuild it.
+    """
+    if not isinstance(data, dict) or data.get("format_version") != CACHE_FORMAT_VERSION:
+        return None
+    if data.get("unidata_version") != unicodedata.unidata_version:
+        return None
+
+    count = len(data["code_points"])
+    names = _unpack(data["names"], count)
+    # Rows whose normalized form equals the name share the name's object.
+    normalized = names.copy()
+    for idx, norm_name in data["normalized"].items():
+        normalized[idx] = norm_name
+
+    return NameCache(
+        code_points=data["code_points"],
+        names=names,
+        normalized=normalized,
+        alt_normalized=_unpack(data["alt_normalized"], count),
+        word_bits={word: 1 << bit for bit, word in enumerate(data["word_vocab"])},
+        word_masks=data["word_masks"],
+        index_words=_unpack(data["index_words"], max(len(data["index_offsets"]) - 1, 0)),
+        index_offsets=data["index_offsets"],
+        index_postings=data["index_postings"],
+    )
+
+
+def _cache_to_payload(cache: NameCache) -> dict[str, object]:
+    """
+    Convert a NameCache into its columnar on-disk payload.
+
+    Arrays pickle as raw bytes and string columns as single packed strings,
+    which unpickle as one copy plus one split instead of one object per row.
+    The normalized column only stores the rows that differ from the name.
+    """
+    return {
+        "format_version": CACHE_FORMAT_VERSION,
+        "unidata_version": unicodedata.unidata_version,
+        "code_points": cache.code_points,
+        "names": _pack(cache.names),
+        "normalized": {
+            idx: norm_name
+            for idx, (name, norm_name) in enumerate(zip(cache.names, cache.normalized, strict=True))
+            if norm_name != name
+        },
+        "alt_normalized": _pack(cache.alt_normalized),
+        "word_vocab": sorted(cache.word_bits, key=cache.word_bits.__getitem__),
+        "word_masks": cache.word_masks,
+        "index_words": _pack(cache.index_words),
+        "index_offsets": cache.index_offsets,
+        "index_postings": cache.index_postings,
+    }
+
+
+def _write_cache(cache: NameCache, path: Path) -> None:
+    """
+    Pickle `cache` to `path`.
+
+    The payload is written to a temporary sibling file that replaces `path`
+    only once it is complete, so an interrupted or concurrent build never
+    leaves a half-written cache behind.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(f"{path.name}.{os.getpid()}.part")
+    try:
+        with partial.open("wb") as f:
+            pickle.dump(_cache_to_payload(cache), f, protocol=5)
+        partial.replace(path)
+    finally:
+        partial.unlink(missing_ok=True)
+
+
+def _load_cache(
+    source: Path | Traversable,
+    *,
+    show: bool,
+    use_color: bool,
+) -> NameCache | None:
+    """
+    Load a persisted cache, reporting whether it was usable.
+
+    A corrupt or truncated file (bad pickle data, an unsupported protocol, or
+    a payload missing columns) is treated like an outdated one and rebuilt.
+    """
+    try:
+        with source.open("rb") as f:
+            loaded = _cache_from_payload(pickle.load(f))  # noqa: S301
+    except (pickle.UnpicklingError, EOFError, ValueError, KeyError, TypeError):
+        loaded = None
+
+    if loaded is not None:
+        message = f'Loaded Unicode name cache from: "{source}"'
+    else:
+        message = f'Unicode name cache at "{source}" is outdated.'
+    echo(
+        message,
+        style=lambda m: format_info(m, use_color=use_color),
+        stream=sys.stderr,
+        show=show,
+        log=True,
+        log_method="info",
+    )
+    return loaded
+
+
 # ---------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------
 
 
+def get_word_sets(cache: NameCache) -> list[frozenset[str]]:
+    """
+    Return the per-row word sets of `cache`, computing them on first use.
+
+    Args:
+        cache: Unicode name cache.
+
+    Returns:
+        list[frozenset[str]]: Words of each row's official and alternate names.
+    """
+    if len(cache.word_sets) != len(cache):
+        # Words are interned: a handful ("LETTER", "LATIN", ...) recur tens of
+        # thousands of times, and sharing one object per word shrinks the
+        # sets' footprint by about a quarter.
+        cache.word_sets = [
+            frozenset(map(sys.intern, norm_name.split() + alt_norm.split()))
+            for norm_name, alt_norm in zip(cache.normalized, cache.alt_normalized, strict=True)
+        ]
+    return cache.word_sets
+
+
+def get_alternate_rows(cache: NameCache) -> tuple[array[int], list[str]]:
+    """
+    Return the rows of `cache` that have an alternate name, computing them on first use.
+
+    Only a small fraction of characters have one, so scorers can run over
+    this compact list instead of the mostly empty `alt_normalized` column.
+
+    Args:
+        cache: Unicode name cache.
+
+    Returns:
+        tuple[array[int], list[str]]: Row indices and their normalized alternate names.
+    """
+    if cache.alternate_rows is None:
+        rows = array("I")
+        alt_names: list[str] = []
+        for idx, alt_norm in enumerate(cache.alt_normalized):
+            if alt_norm:
+                rows.append(idx)
+                alt_names.append(alt_norm)
+        cache.alternate_rows = (rows, alt_names)
+    return cache.alternate_rows
+
+
+def get_length_rows(cache: NameCache) -> dict[int, array[int]]:
+    """
+    Return the rows of `cache` bucketed by name length, computing them on first use.
+
+    A row is listed under the length of its normalized name and, if it has
+    one, of its alternate name. Each bucket is in cache order.
+
+    Args:
+        cache: Unicode name cache.
+
+    Returns:
+        dict[int, array[int]]: Row indices keyed by name length.
+    """
+    if cache.length_rows is None:
+        buckets: dict[int, array[int]] = {}
+        for idx, (norm_name, alt_norm) in enumerate(
+            zip(cache.normalized, cache.alt_normalized, strict=True)
+        ):
+            buckets.setdefault(len(norm_name), array("I")).append(idx)
+            if alt_norm and len(alt_norm) != len(norm_name):
+                buckets.setdefault(len(alt_norm), array("I")).append(idx)
+        cache.length_rows = buckets
+    return cache.length_rows
+
+
+def get_corpus(cache: NameCache) -> str:
+    """
+    Return the normalized names of `cache` as one string, computing it on first use.
+
+    Row `i` contributes line `2 * i` (its normalized name) and line
+    `2 * i + 1` (its normalized alternate name, possibly empty), so the row
+    of any position is half the number of newlines before it.
+
+    Args:
+        cache: Unicode name cache.
+
+    Returns:
+        str: Newline-joined normalized and alternate names, in cache order.
+    """
+    if cache.corpus is None:
+        cache.corpus = "\n".join(
+            chain.from_iterable(zip(cache.normalized, cache.alt_normalized, strict=True))
+        )
+    return cache.corpus
+
+
+def _load_persisted_cache(
+    path: Path, *, use_bundled: bool, show: bool, use_color: bool
+) -> NameCache | None:
+    """Load the cache file at `path`, falling back to the bundled cache if allowed."""
+    loaded = _load_cache(path, show=show, use_color=use_color) if path.exists() else None
+    if loaded is None and use_bundled:
+        bundled = files("charfinder") / "data" / BUNDLED_CACHE_FILE_NAME
+        if bundled.is_file():
+            loaded = _load_cache(bundled, show=show, use_color=use_color)
+    return loaded
+
+
 def build_name_cache(
     *,
     force_rebuild: bool = False,
     show: bool = True,
     use_color: bool = True,
     cache_file_path: Path | None = None,
-) -> dict[str, dict[str, str]]:
+) -> NameCache:
     """
-    Build and return a cache dictionary of characters to original and normalized names,
+    Build and return the Unicode name cache with original and normalized names,
     including alternate names where available.
 
+    Lookup order: the in-process memo, the cache file, the precomputed cache
+    bundled with the package (only when `cache_file_path` is not given), and
+    finally a full rebuild. Persisted caches are only used if they were built
+    for the running `unicodedata.unidata_version`.
+
+    The result is memoized per cache file path for the lifetime of the process;
+    use `force_rebuild=True` to bypass the memo and any persisted cache.
+
     Args:
         force_rebuild (bool): If True, force rebuild the cache even if a cached file exists.
         show (bool): Whether to display progress messages.
@@ -57,29 +477,27 @@ def build_name_cache(
             Optional path to use for cache file; defaults to standard cache path.
 
     Returns:
-        dict[str, dict[str, str]]:
-            Unicode name cache mapping each character to its names.
+        NameCache: Column-oriented Unicode name cache, ordered by code point.
     """
 
+    use_bundled = cache_file_path is None
     if cache_file_path is None:
         cache_file_path = get_cache_file()
 
     path = Path(cache_file_path)
 
-    # Load from cache if available
-    if not force_rebuild and path.exists():
-        with path.open(encoding="utf-8") as f:
-            cache = cast("dict[str, dict[str, str]]", json.load(f))
-        message = f'Loaded Unicode name cache from: "{cache_file_path}"'
-        echo(
-            message,
-            style=lambda m: format_info(m, use_color=use_color),
-            stream=sys.stderr,
-            show=show,
-            log=True,
-            log_method="info",
+    if not force_rebuild:
+        # Reuse the cache already held by this process
+        if (memoized := _CACHE.get(path)) is not None:
+            return memoized
+
+        # Load from the cache file, then the bundled cache, if current
+        loaded = _load_persisted_cache(
+            path, use_bundled=use_bundled, show=show, use_color=use_color
         )
-        return cache
+        if loaded is not None:
+            _CACHE[path] = loaded
+            return loaded
 
     # Rebuild the cache
     message = "Rebuilding Unicode name cache. This may take a few seconds..."
@@ -92,33 +510,53 @@ def build_name_cache(
         log_method="info",
     )
 
-    # Load alternate names once
-    alternate_names = load_alternate_names(show=show, use_color=use_color)
-
-    cache = {}
-    for code in range(sys.maxunicode + 1):
-        char = chr(code)
-        name = unicodedata.name(char, "")
-        if not name:
-            continue
-
-        alt_name = alternate_names.get(char)
+    # Load official and alternate names in one pass over UnicodeData.txt
+    official_names, alternate_names = load_unicode_names(show=show, use_color=use_color)
+    if official_names and not _names_match_runtime(official_names):
+        message = (
+            f'"UnicodeData.txt" does not match Unicode {unicodedata.unidata_version} '
+            "used by this Python; reading official names from unicodedata instead."
+        )
+        echo(
+            message,
+            style=lambda m: format_warning(m, use_color=use_color),
+            stream=sys.stderr,
+            show=show,
+            log=True,
+            log_method="warning",
+        )
+        official_names = {}
 
-        cache_entry = {
-            "original": name,
-            "normalized": normalize(name),
-        }
-        if alt_name:
-            cache_entry["alternate"] = alt_name
-            cache_entry["alternate_normalized"] = normalize(alt_name)
+    cache = NameCache(code_points=array("I"), names=[], normalized=[], alt_normalized=[])
+    if official_names:
+        # UnicodeData.txt lists characters in code point order.
+        # Each row's alternate name is looked up by the character already in
+        # hand, so no row converts between code point and character twice.
+        for char, name in official_names.items():
+            alt_name = alternate_names.get(char)
+            cache.code_points.append(ord(char))
+            cache.names.append(name)
+            cache.normalized.append(_normalize_shared(name))
+            cache.alt_normalized.append(_normalize_shared(alt_name) if alt_name else "")
+    else:
+        # Without a matching file, ask `unicodedata` about every candidate code point.
+        for code_points, names, normalized in _scan_all_code_points(os.cpu_count() or 1):
+            cache.code_points.extend(code_points)
+            cache.names.extend(names)
+            cache.normalized.extend(normalized)
+        # Alternate names (if the file was read at all) are kept for the
+        # characters this Unicode version knows.
+        cache.alt_normalized = [
+            _normalize_shared(alt_name) if (alt_name := alternate_names.get(chr(code))) else ""
+            for code in cache.code_points
+        ]
 
-        cache[char] = cache_entry
+    _build_word_masks(cache)
+    _build_word_index(cache)
 
     # Write cache to disk
     try:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(cache, f, ensure_ascii=False)
+        _write_cache(cache, path)
         message = f'Cache written to: "{cache_file_path}"'
         echo(
             message,
@@ -139,4 +577,5 @@ def build_name_cache(
             log_method="error",
         )
 
+    _CACHE[path] = cache
     return cache
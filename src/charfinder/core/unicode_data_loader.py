@@ -1,9 +1,10 @@
-"""Load and parse the UnicodeData.txt file for alternate character names.
+"""Load and parse the UnicodeData.txt file for official and alternate character names.
 
 Extracts official and alternate names for Unicode characters
 from the Unicode Character Database (UCD), specifically UnicodeData.txt.
 
 Functions:
+    load_unicode_names(): Return mappings of characters to their official and alternate names.
     load_alternate_names(): Return a mapping of characters to their alternate names.
 """
 
@@ -11,7 +12,12 @@ Functions:
 # Imports
 # ---------------------------------------------------------------------
 
+from __future__ import annotations
+
+import shutil
 import sys
+import unicodedata
+from typing import TYPE_CHECKING
 from urllib.error import URLError
 from urllib.request import urlopen
 
@@ -20,58 +26,141 @@ from charfinder.utils.formatter import echo
 from charfinder.utils.logger_setup import get_logger
 from charfinder.utils.logger_styles import format_info, format_warning
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
 logger = get_logger()
 
-__all__ = ["load_alternate_names"]
+__all__ = ["load_alternate_names", "load_unicode_names"]
 
+NAME_INDEX = 1
 ALT_NAME_INDEX = 10
 EXPECTED_MIN_FIELDS = 11
+RANGE_FIRST_SUFFIX = ", First>"
+RANGE_LAST_SUFFIX = ", Last>"
+UNNAMED_RANGE_MARKERS = ("Surrogate", "Private Use")
+
+# ---------------------------------------------------------------------
+# Internal Helpers
+# ---------------------------------------------------------------------
+
+
+def _download_unicode_data(url: str, target: Path) -> None:
+    """
+    Stream UnicodeData.txt from `url` into `target`.
+
+    The body is copied in chunks to a temporary sibling file that replaces
+    `target` only once the download is complete, so an interrupted download
+    never leaves a truncated local copy behind.
+    """
+    target.parent.mkdir(parents=True, exist_ok=True)
+    partial = target.with_name(target.name + ".part")
+    try:
+        with urlopen(url, timeout=5) as response, partial.open("wb") as f:  # noqa: S310
+            shutil.copyfileobj(response, f)
+        partial.replace(target)
+    finally:
+        partial.unlink(missing_ok=True)
+
+
+def _expand_range(first: int, last: int, label: str, official_names: dict[str, str]) -> None:
+    """
+    Name the code points of a `<label, First>`..`<label, Last>` range.
+
+    Ranges (CJK ideographs, Hangul syllables, ...) carry algorithmically
+    derived names, which `unicodedata` computes; surrogate and private use
+    ranges have no names at all.
+    """
+    if any(marker in label for marker in UNNAMED_RANGE_MARKERS):
+        return
+    for code in range(first, last + 1):
+        char = chr(code)
+        name = unicodedata.name(char, "")
+        if name:
+            official_names[char] = name
+
+
+def _parse_unicode_data(lines: Iterable[str]) -> tuple[dict[str, str], dict[str, str]]:
+    """
+    Collect official and alternate names from UnicodeData.txt lines in one pass.
+
+    Each line is split only up to the alternate-name field; the trailing
+    fields stay joined in the last piece and are never looked at. Lines are
+    not stripped, since both names are interior fields. A bounded
+    `str.split()` per line beats one compiled regex over the whole file,
+    which still has to build a match tuple per line and needs the file in
+    memory at once.
+
+    Returns:
+        tuple[dict[str, str], dict[str, str]]: Official and alternate names,
+            keyed by character in code point order.
+    """
+    official_names: dict[str, str] = {}
+    alt_names: dict[str, str] = {}
+    range_start: tuple[int, str] | None = None
+    for line in lines:
+        if line.startswith("#"):
+            continue
+        fields = line.split(";", ALT_NAME_INDEX + 1)
+        if len(fields) < EXPECTED_MIN_FIELDS:
+            continue
+        try:
+            code = int(fields[0], 16)
+        except ValueError:
+            continue
+        char = chr(code)
+
+        name = fields[NAME_INDEX]
+        if not name.startswith("<"):
+            official_names[char] = name
+        elif name.endswith(RANGE_FIRST_SUFFIX):
+            range_start = (code, name[1 : -len(RANGE_FIRST_SUFFIX)])
+        elif name.endswith(RANGE_LAST_SUFFIX) and range_start is not None:
+            first, label = range_start
+            if name[1 : -len(RANGE_LAST_SUFFIX)] == label:
+                _expand_range(first, code, label, official_names)
+            range_start = None
+
+        alt_name = fields[ALT_NAME_INDEX].strip()
+        if alt_name:
+            alt_names[char] = alt_name
+    return official_names, alt_names
+
 
 # ---------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------
 
 
-def load_alternate_names(
+def load_unicode_names(
     *,
     show: bool = True,
     use_color: bool = False,
-) -> dict[str, str]:
+) -> tuple[dict[str, str], dict[str, str]]:
     """
-    Load alternate names from UnicodeData.txt.
+    Load official and alternate names from UnicodeData.txt.
 
     Attempts to download the file if not found locally. Falls back to
-    using the local version if available.
+    using the local version if available. The file is streamed and parsed
+    line by line rather than held in memory as a whole.
 
     Args:
         show: If True, show progress messages to stderr.
         use_color: If True, apply color to terminal output.
 
     Returns:
-        dict[str, str]: Dictionary mapping characters to their alternate names.
+        tuple[dict[str, str], dict[str, str]]: Dictionaries mapping characters
+            to their official and alternate names; both are empty if the file
+            is unavailable.
     """
-    text: str | None = None
-
     unicode_data_url = get_unicode_data_url()
     unicode_data_file = get_unicode_data_file()
 
     # Attempt to download if local file is missing
     if not unicode_data_file.is_file():
         try:
-            with urlopen(unicode_data_url, timeout=5) as response:  # noqa: S310
-                text = response.read().decode("utf-8")
-            unicode_data_file.parent.mkdir(parents=True, exist_ok=True)
-            if text is not None:
-                unicode_data_file.write_text(text, encoding="utf-8")
-            message = f'Downloaded and cached "UnicodeData.txt" from {unicode_data_url}'
-            echo(
-                message,
-                style=lambda m: format_info(m, use_color=use_color),
-                stream=sys.stderr,
-                show=show,
-                log=True,
-                log_method="info",
-            )
+            _download_unicode_data(unicode_data_url, unicode_data_file)
         except (URLError, TimeoutError, OSError):
             fallback_message = 'Could not download "UnicodeData.txt". No local fallback found.'
             echo(
@@ -82,46 +171,38 @@ def load_alternate_names(
                 log=True,
                 log_method="warning",
             )
-            return {}
+            return {}, {}
+        message = f'Downloaded and cached "UnicodeData.txt" from {unicode_data_url}'
     else:
-        text = unicode_data_file.read_text(encoding="utf-8")
         message = f'Loaded "UnicodeData.txt" from local file: {unicode_data_file}'
-        echo(
-            message,
-            style=lambda m: format_info(m, use_color=use_color),
-            stream=sys.stderr,
-            show=show,
-            log=True,
-            log_method="info",
-        )
-
-    if text is None:
-        message = "UnicodeData text must not be None at this point"
-        echo(
-            message,
-            style=lambda m: format_warning(m, use_color=use_color),
-            stream=sys.stderr,
-            show=show,
-            log=True,
-            log_method="error",
-        )
-        return {}
-    # early-returned above, now guaranteed to be str
-    alt_names: dict[str, str] = {}
-    for line in text.splitlines():
-        stripped_line = line.strip()
-        if not stripped_line or stripped_line.startswith("#"):
-            continue
-        fields = stripped_line.split(";")
-        if len(fields) < EXPECTED_MIN_FIELDS:
-            continue
-        code_hex = fields[0]
-        alt_name = fields[ALT_NAME_INDEX].strip()
-        if alt_name:
-            try:
-                char = chr(int(code_hex, 16))
-                alt_names[char] = alt_name
-            except ValueError:
-                continue
 
-    return alt_names
+    with unicode_data_file.open(encoding="utf-8") as f:
+        names = _parse_unicode_data(f)
+
+    echo(
+        message,
+        style=lambda m: format_info(m, use_color=use_color),
+        stream=sys.stderr,
+        show=show,
+        log=True,
+        log_method="info",
+    )
+    return names
+
+
+def load_alternate_names(
+    *,
+    show: bool = True,
+    use_color: bool = False,
+) -> dict[str, str]:
+    """
+    Load alternate names from UnicodeData.txt.
+
+    Args:
+        show: If True, show progress messages to stderr.
+        use_color: If True, apply color to terminal output.
+
+    Returns:
+        dict[str, str]: Dictionary mapping characters to their alternate names.
+    """
+    return load_unicode_names(show=show, use_color=use_color)[1]
@@ -6,16 +6,19 @@ as well as a hybrid strategy combining multiple scores.
 Uses:
     - difflib.SequenceMatcher
     - rapidfuzz.fuzz.ratio
-    - Levenshtein.ratio
+    - rapidfuzz.distance.Indel (Levenshtein ratio)
     - rapidfuzz.fuzz.token_sort_ratio
     - custom simple and normalized ratio algorithms
 
 Functions:
     compute_similarity(): Main function to compute similarity between two strings.
+    prepare_similarity(): Resolve and preprocess a query once, returning a one-argument scorer.
+    compute_similarity_bulk(): Score one query against many candidates in a single call.
+    clear_similarity_cache(): Drop the memoized results of compute_similarity().
     In addition to SUPPORTED_ALGORITHMS, it supports the following built-in algorithms:
         - 'sequencematcher' (uses difflib.SequenceMatcher)
         - 'rapidfuzz' (uses rapidfuzz.fuzz.ratio)
-        - 'levenshtein' (uses Levenshtein.ratio)
+        - 'levenshtein' (uses rapidfuzz.distance.Indel.normalized_similarity)
         - 'token_sort_ratio' (uses rapidfuzz.fuzz.token_sort_ratio)
 
 Internal algorithms:
@@ -28,6 +31,9 @@ Internal algorithms:
 
 Constants:
     SUPPORTED_ALGORITHMS: Dict of algorithm names to implementations.
+    BULK_ALGORITHMS: Algorithms that compute_similarity_bulk scores natively in RapidFuzz.
+    LENGTH_BOUNDED_ALGORITHMS: Per-pair algorithms whose score is bounded by string lengths.
+    SIMILARITY_CACHE_SIZE: Number of pair scores memoized by compute_similarity().
     VALID_FUZZY_MATCH_MODES: Allowed match modes ("single", "hybrid").
     VALID_HYBRID_AGG_FUNCS: Allowed hybrid aggregation functions ("mean", "median", "max", "min").
 """
@@ -39,12 +45,12 @@ Constants:
 from __future__ import annotations
 
 import functools
-import statistics
-import unicodedata
+import importlib.util
 from difflib import SequenceMatcher
 from typing import TYPE_CHECKING, cast
 
-import Levenshtein
+from rapidfuzz import process
+from rapidfuzz.distance import Hamming, Indel
 from rapidfuzz.fuzz import ratio as rapidfuzz_ratio
 from rapidfuzz.fuzz import token_sort_ratio
 
@@ -52,25 +58,61 @@ from charfinder.constants import (
     DEFAULT_FUZZY_ALGO,
     DEFAULT_FUZZY_MATCH_MODE,
     DEFAULT_HYBRID_AGG_FUNC,
-    DEFAULT_NORMALIZATION_FORM,
     FUZZY_ALGO_ALIASES,
     FUZZY_HYBRID_WEIGHTS,
+    VALID_FUZZY_MATCH_MODE_SET,
     VALID_FUZZY_MATCH_MODES,
     VALID_HYBRID_AGG_FUNCS,
     FuzzyAlgorithm,
     MatchMode,
 )
+from charfinder.utils.normalizer import normalize
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
     from charfinder.types import AlgorithmFn
 
-__all__ = ["compute_similarity", "resolve_algorithm_name"]
+__all__ = [
+    "clear_similarity_cache",
+    "compute_similarity",
+    "compute_similarity_bulk",
+    "prepare_similarity",
+    "resolve_algorithm_name",
+]
+
+# Slack subtracted from score cutoffs so that float rounding (in scale
+# conversions or partial sums) never drops a candidate scoring exactly at
+# the cutoff.
+_CUTOFF_EPSILON = 1e-9
+
+# Hybrid component weights, looked up once instead of per scored pair.
+_SIMPLE_WEIGHT = FUZZY_HYBRID_WEIGHTS.get("simple_ratio", 0.0)
+_NORMALIZED_WEIGHT = FUZZY_HYBRID_WEIGHTS.get("normalized_ratio", 0.0)
+_LEVENSHTEIN_WEIGHT = FUZZY_HYBRID_WEIGHTS.get("levenshtein_ratio", 0.0)
+_TOKEN_SORT_WEIGHT = FUZZY_HYBRID_WEIGHTS.get("token_sort_ratio", 0.0)
 
 # ---------------------------------------------------------------------
 # Algorithms
 # ---------------------------------------------------------------------
 
 
+def _count_positional_matches(a: str, b: str) -> int:
+    """Count the positions at which `a` and `b` hold the same character."""
+    # The Hamming similarity with padding counts the equal positions of the
+    # common prefix length (padded positions never match), in a compiled
+    # RapidFuzz loop. Narrowing ASCII names to bytes in Python does not pay
+    # off: an XOR-and-popcount over the encoded names as big ints measured
+    # slower than even a map(operator.eq) count across the name corpus.
+    return Hamming.similarity(a, b, pad=True)
+
+
+def _positional_ratio(a: str, b: str) -> float:
+    """Share of positions holding the same character, over the longer length."""
+    longest = max(len(a), len(b))
+    return _count_positional_matches(a, b) / longest if longest > 0 else 0.0
+
+
 def simple_ratio(a: str, b: str) -> float:
     """
     Compute the ratio of matching characters in order.
@@ -82,8 +124,7 @@ def simple_ratio(a: str, b: str) -> float:
     Returns:
         float: Similarity score in the range [0.0, 1.0].
     """
-    matches = sum(1 for c1, c2 in zip(a, b, strict=False) if c1 == c2)
-    return matches / max(len(a), len(b)) if max(len(a), len(b)) > 0 else 0.0
+    return _positional_ratio(a, b)
 
 
 def normalized_ratio(a: str, b: str) -> float:
@@ -97,10 +138,7 @@ def normalized_ratio(a: str, b: str) -> float:
     Returns:
         float: Similarity score in the range [0.0, 1.0].
     """
-    norm_a = unicodedata.normalize(DEFAULT_NORMALIZATION_FORM, a).upper()
-    norm_b = unicodedata.normalize(DEFAULT_NORMALIZATION_FORM, b).upper()
-    matches = sum(1 for c1, c2 in zip(norm_a, norm_b, strict=False) if c1 == c2)
-    return matches / max(len(norm_a), len(norm_b)) if max(len(norm_a), len(norm_b)) > 0 else 0.0
+    return _positional_ratio(normalize(a), normalize(b))
 
 
 def levenshtein_ratio(a: str, b: str) -> float:
@@ -114,7 +152,12 @@ def levenshtein_ratio(a: str, b: str) -> float:
     Returns:
         float: Similarity score in the range [0.0, 1.0].
     """
-    return float(Levenshtein.ratio(a, b))
+    # The classic Levenshtein ratio counts a substitution as two edits, which
+    # is the normalized Indel similarity; RapidFuzz computes it bit-parallel.
+    # Unit-cost edit distances (e.g. StringZilla's) are a different metric and
+    # would change scores; Unicode names are at most 88 characters, within
+    # two 64-bit blocks of RapidFuzz's kernel.
+    return Indel.normalized_similarity(a, b)
 
 
 def token_sort_ratio_score(a: str, b: str) -> float:
@@ -131,14 +174,25 @@ def token_sort_ratio_score(a: str, b: str) -> float:
     return token_sort_ratio(a, b) / 100.0
 
 
-def hybrid_score(a: str, b: str, agg_fn: VALID_HYBRID_AGG_FUNCS = DEFAULT_HYBRID_AGG_FUNC) -> float:
+def hybrid_score(
+    a: str,
+    b: str,
+    agg_fn: VALID_HYBRID_AGG_FUNCS = DEFAULT_HYBRID_AGG_FUNC,
+    score_cutoff: float | None = None,
+) -> float:
     """
     Hybrid score combining multiple algorithms with a chosen aggregate function.
 
+    Components are computed cheapest first, and the costlier ones are skipped
+    once the aggregate is settled: a 1.0 decides "max" and a 0.0 decides
+    "min". With `score_cutoff`, a "min" or "mean" that can no longer reach
+    the cutoff is reported as 0.0.
+
     Args:
         a: First string.
         b: Second string.
         agg_fn: Aggregation function to combine scores ("mean", "median", "max", "min").
+        score_cutoff: If given, any score below it may be reported as 0.0.
 
     Returns:
         float: Hybrid similarity score in the range [0.0, 1.0].
@@ -146,22 +200,58 @@ def hybrid_score(a: str, b: str, agg_fn: VALID_HYBRID_AGG_FUNCS = DEFAULT_HYBRID
     Raises:
         ValueError: If agg_fn is not supported.
     """
-    components = {
-        "simple_ratio": simple_ratio(a, b),
-        "normalized_ratio": normalized_ratio(a, b),
-        "levenshtein_ratio": levenshtein_ratio(a, b),
-        "token_sort_ratio": token_sort_ratio_score(a, b),
-    }
+    floor = score_cutoff or 0.0
+
+    # Inputs that normalization leaves unchanged (uppercased ASCII, as passed
+    # by prepare_similarity) have a normalized ratio equal to the simple one.
+    simple = _positional_ratio(a, b)
+    norm_a = normalize(a)
+    norm_b = normalize(b)
+    normalized = simple if norm_a == a and norm_b == b else _positional_ratio(norm_a, norm_b)
+    if agg_fn == "max" and max(simple, normalized) == 1.0:
+        return 1.0
+    if agg_fn == "min" and (min(simple, normalized) == 0.0 or min(simple, normalized) < floor):
+        return 0.0
 
-    if agg_fn == "mean":
-        return sum(
-            components[name] * FUZZY_HYBRID_WEIGHTS.get(name, 0.0) for name in FUZZY_HYBRID_WEIGHTS
+    levenshtein = Indel.normalized_similarity(a, b)
+    if agg_fn == "max" and levenshtein == 1.0:
+        return 1.0
+    if agg_fn == "min" and (levenshtein == 0.0 or levenshtein < floor):
+        return 0.0
+    # The token sort ratio is the costliest component; skip it when even a
+    # perfect token sort score would leave the mean below the cutoff.
+    if agg_fn == "mean" and floor > 0.0:
+        reachable = (
+            simple * _SIMPLE_WEIGHT
+            + normalized * _NORMALIZED_WEIGHT
+            + levenshtein * _LEVENSHTEIN_WEIGHT
+            + _TOKEN_SORT_WEIGHT
         )
+        if reachable < floor - _CUTOFF_EPSILON:
+            return 0.0
 
-    scores = list(components.values())
+    scores = (simple, normalized, levenshtein, token_sort_ratio(a, b) / 100.0)
+    return _aggregate_components(scores, agg_fn)
+
+
+def _aggregate_components(scores: tuple[float, float, float, float], agg_fn: str) -> float:
+    """Combine the simple, normalized, Levenshtein and token sort scores with `agg_fn`."""
+    if agg_fn == "mean":
+        simple, normalized, levenshtein, token_sort = scores
+        return (
+            simple * _SIMPLE_WEIGHT
+            + normalized * _NORMALIZED_WEIGHT
+            + levenshtein * _LEVENSHTEIN_WEIGHT
+            + token_sort * _TOKEN_SORT_WEIGHT
+        )
 
     if agg_fn == "median":
-        return statistics.median(scores)
+        # Same result as statistics.median, without its type dispatch.
+        ordered = sorted(scores)
+        middle = len(ordered) // 2
+        if len(ordered) % 2:
+            return ordered[middle]
+        return (ordered[middle - 1] + ordered[middle]) / 2
     if agg_fn == "max":
         return max(scores)
     if agg_fn == "min":
@@ -171,6 +261,30 @@ def hybrid_score(a: str, b: str, agg_fn: VALID_HYBRID_AGG_FUNCS = DEFAULT_HYBRID
     raise ValueError(message)
 
 
+def _hybrid_mean(a: str, b: str) -> float:
+    """Hybrid score with the default weighted-mean aggregation."""
+    return hybrid_score(a, b, "mean")
+
+
+def _hybrid_scorer(agg_fn: VALID_HYBRID_AGG_FUNCS, score_cutoff: float | None) -> AlgorithmFn:
+    """Bind hybrid_score's options in a closure, which calls faster than a keyword partial."""
+
+    def score(a: str, b: str) -> float:
+        return hybrid_score(a, b, agg_fn, score_cutoff)
+
+    return score
+
+
+def _sequencematcher_ratio(a: str, b: str) -> float:
+    """Similarity ratio computed by difflib.SequenceMatcher."""
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def _rapidfuzz_ratio(a: str, b: str) -> float:
+    """Plain RapidFuzz ratio scaled to [0.0, 1.0]."""
+    return rapidfuzz_ratio(a, b) / 100.0
+
+
 # ---------------------------------------------------------------------
 # Supported Algorithms
 # ---------------------------------------------------------------------
@@ -180,9 +294,53 @@ SUPPORTED_ALGORITHMS: dict[FuzzyAlgorithm, AlgorithmFn] = {
     "normalized_ratio": normalized_ratio,
     "levenshtein_ratio": levenshtein_ratio,
     "token_sort_ratio": token_sort_ratio_score,
-    "hybrid_score": functools.partial(hybrid_score, agg_fn="mean"),
+    "hybrid_score": _hybrid_mean,
 }
 
+# Single-mode dispatch table: every resolvable algorithm name, including the
+# built-ins that are not listed in SUPPORTED_ALGORITHMS. levenshtein_ratio is
+# bound to the RapidFuzz scorer itself, so short names pay no wrapper frame.
+_SINGLE_MODE_ALGORITHMS: dict[FuzzyAlgorithm, AlgorithmFn] = {
+    **SUPPORTED_ALGORITHMS,
+    "sequencematcher": _sequencematcher_ratio,
+    "rapidfuzz": _rapidfuzz_ratio,
+    "levenshtein_ratio": Indel.normalized_similarity,
+}
+
+# Every accepted spelling of an algorithm, casefolded and mapped to its
+# internal name, so that resolution and validation are a single lookup.
+_ALGORITHM_NAMES: dict[str, FuzzyAlgorithm] = {
+    **{name.casefold(): name for name in SUPPORTED_ALGORITHMS},
+    **{
+        alias.casefold(): cast("FuzzyAlgorithm", name) for alias, name in FUZZY_ALGO_ALIASES.items()
+    },
+}
+
+# Single-mode algorithms RapidFuzz can score natively over a whole candidate
+# list, mapped to the scorer and the scale of its scores. Each gives exactly
+# the score of the per-pair wrapper.
+_BULK_SCORERS: dict[str, tuple[Callable[..., float], float]] = {
+    "rapidfuzz": (rapidfuzz_ratio, 100.0),
+    "token_sort_ratio": (token_sort_ratio, 100.0),
+    "levenshtein_ratio": (Indel.normalized_similarity, 1.0),
+}
+
+BULK_ALGORITHMS = frozenset(_BULK_SCORERS)
+
+# Single-mode algorithms without a native cutoff whose similarity can never
+# exceed 2 * min(len(a), len(b)) / (len(a) + len(b)), so pairs can be ruled
+# out against a score cutoff by length alone.
+LENGTH_BOUNDED_ALGORITHMS = frozenset({"sequencematcher", "simple_ratio"})
+
+# process.cdist returns NumPy arrays; without NumPy, bulk scoring stays on
+# the single-threaded process.extract path.
+_NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+
+# Pair scores memoized by compute_similarity(). Keys are the preprocessed
+# strings plus the scoring parameters, so retyped queries and duplicate
+# candidates hit the cache.
+SIMILARITY_CACHE_SIZE = 100_000
+
 
 def resolve_algorithm_name(name: str) -> FuzzyAlgorithm:
     """
@@ -197,12 +355,9 @@ def resolve_algorithm_name(name: str) -> FuzzyAlgorithm:
     Raises:
         ValueError: If the name is unknown.
     """
-    folded = name.casefold()
-
-    if folded in SUPPORTED_ALGORITHMS:
-        return cast("FuzzyAlgorithm", folded)
-    if folded in FUZZY_ALGO_ALIASES:
-        return cast("FuzzyAlgorithm", FUZZY_ALGO_ALIASES[folded])
+    resolved = _ALGORITHM_NAMES.get(name.casefold())
+    if resolved is not None:
+        return resolved
 
     message = (
         f"Unknown fuzzy algorithm: '{name}'. "
@@ -226,17 +381,136 @@ def get_supported_algorithms() -> list[str]:
     return list(SUPPORTED_ALGORITHMS.keys())
 
 
-def compute_similarity(
+def prepare_similarity(  # noqa: PLR0913
+    query: str,
+    algorithm: FuzzyAlgorithm = DEFAULT_FUZZY_ALGO,
+    mode: MatchMode = DEFAULT_FUZZY_MATCH_MODE,
+    agg_fn: VALID_HYBRID_AGG_FUNCS = DEFAULT_HYBRID_AGG_FUNC,
+    *,
+    score_cutoff: float | None = None,
+    prepared: bool = False,
+) -> Callable[[str], float]:
+    """
+    Prepare a scorer that compares many candidates against one query.
+
+    Algorithm resolution, mode validation and query preprocessing happen
+    once here instead of once per candidate, so scanning a whole corpus
+    only pays for the similarity computation itself. Each call of the
+    returned scorer gives exactly `compute_similarity(query, candidate, ...)`
+    for every score that reaches `score_cutoff`.
+
+    Args:
+        query: Query string compared against every candidate.
+        algorithm: One of 'sequencematcher', 'rapidfuzz', or 'levenshtein'.
+        mode: 'single' (default) to use one algorithm, or 'hybrid' to use hybrid_score
+            (supports configurable aggregation).
+        agg_fn: Aggregation function to aggregate the scores.
+        score_cutoff: If given, scores below it may be reported as 0.0, which
+            lets hybrid scoring skip components once the result is settled.
+        prepared: Set when candidates will already be stripped and uppercased,
+            so the scorer uses them as given instead of preprocessing each one.
+
+    Returns:
+        Callable[[str], float]: Scorer mapping a candidate to a similarity in [0.0, 1.0].
+
+    Raises:
+        ValueError: If match mode is invalid.
+    """
+    resolved_algo = resolve_algorithm_name(algorithm)
+
+    if mode not in VALID_FUZZY_MATCH_MODE_SET:
+        message = (
+            f"Unsupported match mode: '{mode}'. "
+            f"Expected one of: {', '.join(VALID_FUZZY_MATCH_MODES)}."
+        )
+        raise ValueError(message)
+
+    prepared_query = query.strip().upper()
+
+    algorithm_fn: AlgorithmFn
+    if mode == "hybrid":
+        algorithm_fn = _hybrid_scorer(agg_fn, score_cutoff)
+    elif score_cutoff and resolved_algo in _BULK_SCORERS:
+        algorithm_fn = _with_native_cutoff(*_BULK_SCORERS[resolved_algo], score_cutoff)
+    else:
+        algorithm_fn = _SINGLE_MODE_ALGORITHMS[resolved_algo]
+
+    score_prepared = _prepared_scorer(
+        prepared_query,
+        algorithm_fn,
+        score_cutoff if mode == "single" and resolved_algo in LENGTH_BOUNDED_ALGORITHMS else None,
+    )
+    if prepared:
+        return score_prepared
+
+    def score(candidate: str) -> float:
+        return score_prepared(candidate.strip().upper())
+
+    return score
+
+
+def _prepared_scorer(
+    prepared_query: str, algorithm_fn: AlgorithmFn, length_cutoff: float | None
+) -> Callable[[str], float]:
+    """
+    Build a scorer for candidates that are already stripped and uppercased.
+
+    With `length_cutoff`, candidates whose lengths alone rule out reaching it
+    score 0.0 without running `algorithm_fn`.
+    """
+    # `==` on str checks identity before comparing characters, so a
+    # candidate that is the query object itself costs no scan.
+    if not length_cutoff:
+
+        def score(candidate: str) -> float:
+            if candidate == prepared_query:
+                return 1.0
+            return algorithm_fn(prepared_query, candidate)
+
+        return score
+
+    query_len = len(prepared_query)
+    min_bound = length_cutoff - _CUTOFF_EPSILON
+
+    def score_length_bounded(candidate: str) -> float:
+        if candidate == prepared_query:
+            return 1.0
+        candidate_len = len(candidate)
+        if 2 * min(query_len, candidate_len) < min_bound * (query_len + candidate_len):
+            return 0.0
+        return algorithm_fn(prepared_query, candidate)
+
+    return score_length_bounded
+
+
+def _with_native_cutoff(
+    scorer: Callable[..., float], scale: float, score_cutoff: float
+) -> AlgorithmFn:
+    """Wrap a RapidFuzz scorer so that it stops early below `score_cutoff`."""
+    native_cutoff = max(score_cutoff * scale - _CUTOFF_EPSILON, 0.0)
+
+    def score(a: str, b: str) -> float:
+        return scorer(a, b, score_cutoff=native_cutoff) / scale
+
+    return score
+
+
+def compute_similarity(  # noqa: PLR0913
     s1: str,
     s2: str,
     algorithm: FuzzyAlgorithm = DEFAULT_FUZZY_ALGO,
     mode: MatchMode = DEFAULT_FUZZY_MATCH_MODE,
     agg_fn: VALID_HYBRID_AGG_FUNCS = DEFAULT_HYBRID_AGG_FUNC,
+    *,
+    score_cutoff: float | None = None,
 ) -> float:
     """
     Compute similarity between two strings using a specified fuzzy algorithm
     or a hybrid strategy.
 
+    Both strings are stripped and uppercased, and the score of each
+    preprocessed pair is memoized (see SIMILARITY_CACHE_SIZE).
+
     Args:
         s1: First string (e.g., query).
         s2: Second string (e.g., candidate).
@@ -244,6 +518,8 @@ def compute_similarity(
         mode: 'single' (default) to use one algorithm, or 'hybrid' to use hybrid_score
             (supports configurable aggregation).
         agg_fn: Aggregation function to aggregate the scores.
+        score_cutoff: If given, scores below it may be reported as 0.0, which
+            lets pairs be ruled out by length or scored with an early exit.
 
     Returns:
         float: Similarity score in the range [0.0, 1.0].
@@ -252,27 +528,131 @@ def compute_similarity(
         ValueError: If match mode is invalid.
         RuntimeError: If an unexpected algorithm is passed.
     """
-    resolved_algo = resolve_algorithm_name(algorithm)
+    return _compute_similarity_cached(
+        s1.strip().upper(), s2.strip().upper(), algorithm, mode, agg_fn, score_cutoff
+    )
 
-    if mode not in VALID_FUZZY_MATCH_MODES:
-        message = (
-            f"Unsupported match mode: '{mode}'. "
-            f"Expected one of: {', '.join(VALID_FUZZY_MATCH_MODES)}."
-        )
-        raise ValueError(message)
 
-    s1 = s1.strip().upper()
-    s2 = s2.strip().upper()
+@functools.lru_cache(maxsize=SIMILARITY_CACHE_SIZE)
+def _compute_similarity_cached(  # noqa: PLR0913, PLR0917
+    prepared_s1: str,
+    prepared_s2: str,
+    algorithm: FuzzyAlgorithm,
+    mode: MatchMode,
+    agg_fn: VALID_HYBRID_AGG_FUNCS,
+    score_cutoff: float | None,
+) -> float:
+    return prepare_similarity(prepared_s1, algorithm, mode, agg_fn, score_cutoff=score_cutoff)(
+        prepared_s2
+    )
 
-    if s1 == s2:
-        return 1.0
 
-    if mode == "hybrid":
-        return hybrid_score(s1, s2, agg_fn=agg_fn)
+def clear_similarity_cache() -> None:
+    """Drop the pair scores memoized by compute_similarity()."""
+    _compute_similarity_cached.cache_clear()
+
+
+def _prepare_candidate(candidate: str) -> str:
+    return candidate.strip().upper()
+
+
+def _native_hits(  # noqa: PLR0913
+    query: str,
+    candidates: Sequence[str],
+    scorer: Callable[..., float],
+    cutoff: float | None,
+    *,
+    processor: Callable[[str], str] | None,
+    workers: int,
+) -> list[tuple[float, int]]:
+    """Return `(raw score, index)` for the candidates reaching `cutoff` on the scorer's scale."""
+    if workers == 1 or not _NUMPY_AVAILABLE:
+        return [
+            (raw_score, idx)
+            for _, raw_score, idx in process.extract(
+                query,
+                candidates,
+                scorer=scorer,
+                processor=processor,
+                limit=None,
+                score_cutoff=cutoff,
+            )
+        ]
+
+    # cdist fills a dense row, reporting candidates below the cutoff as 0;
+    # float64 keeps the scores identical to the extract path.
+    row = process.cdist(
+        [query],
+        candidates,
+        scorer=scorer,
+        processor=processor,
+        score_cutoff=cutoff,
+        dtype="float64",
+        workers=workers,
+    )[0]
+    indices = row.nonzero()[0].tolist() if cutoff else range(len(row))
+    return [(float(row[idx]), idx) for idx in indices]
+
+
+def compute_similarity_bulk(  # noqa: PLR0913
+    query: str,
+    candidates: Sequence[str],
+    algorithm: FuzzyAlgorithm = DEFAULT_FUZZY_ALGO,
+    mode: MatchMode = DEFAULT_FUZZY_MATCH_MODE,
+    agg_fn: VALID_HYBRID_AGG_FUNCS = DEFAULT_HYBRID_AGG_FUNC,
+    *,
+    score_cutoff: float | None = None,
+    prepared: bool = False,
+    workers: int = 1,
+) -> dict[int, float]:
+    """
+    Score one query against many candidates.
+
+    Algorithms in BULK_ALGORITHMS are scored by a single RapidFuzz call that
+    loops over the candidates natively, so the per-candidate cost is the
+    similarity computation alone; every other algorithm and the hybrid mode
+    fall back to a scorer from `prepare_similarity`. Scores are exactly those
+    of `compute_similarity(query, candidate, ...)`.
 
-    if resolved_algo == "sequencematcher":
-        return SequenceMatcher(None, s1, s2).ratio()
-    if resolved_algo == "rapidfuzz":
-        return float(rapidfuzz_ratio(s1, s2)) / 100.0
+    With `workers` other than 1 and NumPy installed, the native call is
+    `rapidfuzz.process.cdist`, which releases the GIL and spreads the
+    candidates over that many threads (-1 for one per core).
 
-    return SUPPORTED_ALGORITHMS[resolved_algo](s1, s2)
+    Args:
+        query: Query string compared against every candidate.
+        candidates: Candidate strings.
+        algorithm: Fuzzy algorithm name (aliases are accepted).
+        mode: 'single' (default) or 'hybrid'.
+        agg_fn: Aggregation function for hybrid mode.
+        score_cutoff: If given, only candidates scoring at least this much are returned.
+        prepared: Set when candidates are already stripped and uppercased,
+            to skip preprocessing them again.
+        workers: Threads for native scoring; only used when NumPy is available.
+
+    Returns:
+        dict[int, float]: Scores keyed by candidate index, in candidate order.
+
+    Raises:
+        ValueError: If the algorithm or match mode is invalid.
+    """
+    if mode == "single" and (bulk := _BULK_SCORERS.get(resolve_algorithm_name(algorithm))):
+        scorer, scale = bulk
+        cutoff = max(score_cutoff * scale - _CUTOFF_EPSILON, 0.0) if score_cutoff else None
+        hits = _native_hits(
+            query.strip().upper(),
+            candidates,
+            scorer,
+            cutoff,
+            processor=None if prepared else _prepare_candidate,
+            workers=workers,
+        )
+        scores = {idx: raw_score / scale for raw_score, idx in hits}
+        if score_cutoff:
+            scores = {idx: score for idx, score in scores.items() if score >= score_cutoff}
+        return dict(sorted(scores.items()))
+
+    score_candidate = prepare_similarity(query, algorithm, mode, agg_fn, prepared=prepared)
+    scores = {idx: score_candidate(candidate) for idx, candidate in enumerate(candidates)}
+    if score_cutoff is None:
+        return scores
+    return {idx: score for idx, score in scores.items() if score >= score_cutoff}
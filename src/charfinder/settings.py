@@ -14,6 +14,7 @@ Functions:
     is_dev(), is_uat(), is_prod(), is_test_mode(), is_test(): Check current environment.
     get_log_max_bytes(): Return maximum log size.
     get_log_backup_count(): Return number of log backups.
+    clear_settings_cache(): Forget memoized environment-derived settings.
 """
 
 
@@ -23,15 +24,16 @@ Functions:
 
 from __future__ import annotations
 
+import functools
 import os
+import unicodedata
 from pathlib import Path
 from typing import cast
 
-from dotenv import load_dotenv
-
 from charfinder.constants import (
     DEFAULT_LOG_ROOT,
     ENV_ENVIRONMENT,
+    ENV_FORCE_DOTENV,
     ENV_LOG_BACKUP_COUNT,
     ENV_LOG_MAX_BYTES,
 )
@@ -39,6 +41,7 @@ from charfinder.utils.formatter import echo
 from charfinder.utils.logger_styles import format_error, format_settings, format_warning
 
 __all__ = [
+    "clear_settings_cache",
     "get_cache_file",
     "get_environment",
     "get_log_backup_count",
@@ -61,10 +64,14 @@ __all__ = [
 # ---------------------------------------------------------------------
 
 
+@functools.cache
 def get_environment() -> str:
     """
     Return CHARFINDER_ENV uppercased (default is DEV).
 
+    The value is read once and memoized; call `clear_settings_cache()` after
+    changing the environment.
+
     Returns:
         One of DEV, UAT, PROD, TEST.
     """
@@ -112,10 +119,14 @@ def is_test() -> bool:
 # ---------------------------------------------------------------------
 
 
+@functools.cache
 def safe_int(env_var: str, default: int) -> int:
     """
     Safely retrieve an integer from an environment variable, falling back to a default.
 
+    Results are memoized per `(env_var, default)`, so an invalid value is
+    only reported once until `clear_settings_cache()` is called.
+
     Args:
         env_var: Name of the environment variable.
         default: Default value to use if missing or invalid.
@@ -133,29 +144,68 @@ def safe_int(env_var: str, default: int) -> int:
     return default
 
 
+@functools.cache
 def get_log_max_bytes() -> int:
     """Return maximum log file size in bytes."""
     return safe_int(ENV_LOG_MAX_BYTES, 1_000_000)
 
 
+@functools.cache
 def get_log_backup_count() -> int:
     """Return number of log file backups to keep."""
     return safe_int(ENV_LOG_BACKUP_COUNT, 5)
 
 
+# ---------------------------------------------------------------------
+# Cache invalidation
+# ---------------------------------------------------------------------
+
+
+def _clear_environment_cache() -> None:
+    """Forget memoized values read from environment variables."""
+    for accessor in (
+        get_environment,
+        safe_int,
+        get_log_max_bytes,
+        get_log_backup_count,
+        get_cache_file,
+        get_log_dir,
+    ):
+        accessor.cache_clear()
+
+
+def clear_settings_cache() -> None:
+    """
+    Forget all memoized settings, including the resolved root dir and .env path.
+
+    Call this after modifying the process environment or the project layout
+    (for example when a test patches an environment variable or ROOT_DIR).
+    """
+    _clear_environment_cache()
+    get_root_dir.cache_clear()
+    resolve_dotenv_path.cache_clear()
+
+
 # ---------------------------------------------------------------------
 # Root dir handling (used for locating .env if needed)
 # ---------------------------------------------------------------------
 
 
+# Resolved once at import; a module-level ROOT_DIR (set by tests) takes precedence.
+_DEFAULT_ROOT_DIR = Path(__file__).resolve().parents[2]
+
+
+@functools.lru_cache(maxsize=1)
 def get_root_dir() -> Path:
     """
     Dynamically return the project root directory.
 
+    Resolved once and memoized; see `clear_settings_cache()`.
+
     Returns:
         Absolute path to the project's root directory.
     """
-    return cast("Path", globals().get("ROOT_DIR", Path(__file__).resolve().parents[2]))
+    return cast("Path", globals().get("ROOT_DIR", _DEFAULT_ROOT_DIR))
 
 
 # ---------------------------------------------------------------------
@@ -163,6 +213,7 @@ def get_root_dir() -> Path:
 # ---------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=1)
 def resolve_dotenv_path() -> Path | None:
     """
     Determine which .env file to load.
@@ -171,18 +222,20 @@ def resolve_dotenv_path() -> Path | None:
       1. DOTENV_PATH (explicit override)
       2. .env in project root
       3. None if not found
-    """
-    root_dir = get_root_dir()
 
+    The result is memoized, so `load_settings()` and
+    `resolve_loaded_dotenv_paths()` share one lookup.
+    """
     if custom := os.getenv("DOTENV_PATH"):
         custom_path = Path(custom)
-        if not custom_path.exists() and os.getenv("CHARFINDER_DEBUG_ENV_LOAD") == "1":
+        # Only stat the override when the warning below can actually be shown.
+        if os.getenv("CHARFINDER_DEBUG_ENV_LOAD") == "1" and not custom_path.exists():
             message = f'DOTENV_PATH is set to "{custom_path}" but the file does not exist.'
             echo(msg=message, style=format_warning, show=True, log=False, log_method="warning")
         return custom_path
 
-    default_env = root_dir / ".env"
-    return default_env if default_env.exists() else None
+    default_env = get_root_dir() / ".env"
+    return default_env if default_env.is_file() else None
 
 
 # ---------------------------------------------------------------------
@@ -196,6 +249,10 @@ def load_settings(
     """
     Load .env settings and optionally log the process.
 
+    In test mode (CHARFINDER_ENV=TEST) the environment is managed by the
+    caller, so no .env file is resolved or loaded unless
+    CHARFINDER_FORCE_DOTENV is set.
+
     Args:
         do_load_dotenv: Whether to load the .env file.
         debug: Whether debug mode is enabled.
@@ -204,12 +261,20 @@ def load_settings(
     Returns:
         List of loaded .env file paths.
     """
+    if is_test_mode() and not os.getenv(ENV_FORCE_DOTENV):
+        return []
+
     loaded: list[Path] = []
     dotenv_path = resolve_dotenv_path()
 
     if do_load_dotenv and dotenv_path and dotenv_path.is_file():
+        # Imported here so runs without a .env file never load python-dotenv.
+        from dotenv import load_dotenv
+
         load_dotenv(dotenv_path=dotenv_path, override=is_test())
         loaded.append(dotenv_path)
+        # The .env file may have changed values that were already memoized.
+        _clear_environment_cache()
 
     if not loaded:
         message = "No .env file loaded — using system env or defaults."
@@ -222,26 +287,39 @@ def load_settings(
 # ---------------------------------------------------------------------
 
 
+@functools.cache
 def get_cache_file() -> Path:
     """Return the cache file path."""
     env_value = os.getenv("CHARFINDER_CACHE_FILE_PATH")
     if env_value:
         return get_root_dir() / env_value
-    return get_root_dir() / "data" / "cache" / "unicode_name_cache.json"
+    return get_root_dir() / "data" / "cache" / "unicode_name_cache.pkl"
 
 
 def get_unicode_data_file() -> Path:
-    """Return the UnicodeData.txt file path."""
+    """
+    Return the UnicodeData.txt file path.
+
+    The default file name carries the Unicode version that `unicodedata`
+    implements, matching `get_unicode_data_url()`, so a file downloaded for
+    another Python is never mistaken for this one.
+    """
     env_value = os.getenv("CHARFINDER_UNICODE_DATA_FILE_PATH")
     if env_value:
         return get_root_dir() / env_value
-    return get_root_dir() / "data" / "UnicodeData.txt"
+    return get_root_dir() / "data" / f"UnicodeData-{unicodedata.unidata_version}.txt"
 
 
 def get_unicode_data_url() -> str:
+    """
+    Return the UnicodeData.txt download URL.
+
+    Defaults to the file of the Unicode version that `unicodedata` implements,
+    so the downloaded names match the version the name cache is stamped with.
+    """
     return os.getenv(
         "UNICODE_DATA_URL",
-        "https://www.unicode.org/Public/UCD/latest/ucd/UnicodeData.txt",
+        f"https://www.unicode.org/Public/{unicodedata.unidata_version}/ucd/UnicodeData.txt",
     )
 
 
@@ -250,6 +328,7 @@ def get_unicode_data_url() -> str:
 # ---------------------------------------------------------------------
 
 
+@functools.cache
 def get_log_dir() -> Path:
     """
     Return per-environment log directory path.
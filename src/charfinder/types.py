@@ -3,8 +3,10 @@ Type definitions and reusable dataclasses for CharFinder.
 
 Defines:
 - AlgorithmFn: Callable type alias for fuzzy algorithm functions.
-- FuzzyMatchContext: Dataclass holding parameters for fuzzy matching.
-- SearchConfig: Dataclass grouping parameters for Unicode search.
+- MatchRow, FuzzyMemoKey: Tuple aliases for match rows and fuzzy memo keys.
+- FuzzyMatchContext: Frozen, slotted dataclass holding parameters for fuzzy matching.
+- SearchConfig: Frozen, slotted dataclass grouping parameters for Unicode search.
+- NameCache: Column-oriented Unicode name cache.
 - CharMatch: TypedDict representing a single match result.
 """
 
@@ -14,8 +16,10 @@ Defines:
 
 from __future__ import annotations
 
+from array import array
+from collections import OrderedDict
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from typing_extensions import NotRequired, TypedDict
@@ -30,8 +34,14 @@ if TYPE_CHECKING:
 
 AlgorithmFn = Callable[[str, str], float]
 
+# One match as (code point, character, name, score or None).
+MatchRow = tuple[int, str, str, float | None]
 
-@dataclass
+# Fuzzy memo key: (normalized query, threshold, algorithm, match mode, agg_fn).
+FuzzyMemoKey = tuple[str, float, str, str, str]
+
+
+@dataclass(frozen=True, slots=True)
 class FuzzyMatchContext:
     threshold: float
     fuzzy_algo: FuzzyAlgorithm
@@ -43,10 +53,82 @@ class FuzzyMatchContext:
 
 
 @dataclass
+class NameCache:
+    """
+    Unicode name cache stored column-wise (struct of arrays).
+
+    Row `i` describes the character `chr(code_points[i])`. Code points are
+    kept in a compact `array("I")` rather than as boxed ints, and the
+    character itself is only materialized for rows that actually match.
+    `alt_normalized[i]` is the empty string when the character has no
+    alternate name, so membership tests need no None check. Both normalized
+    columns are the corpus normalized once at build time: stripped and
+    uppercased, so scorers take them as prepared candidates.
+
+    `word_bits` assigns one bit to each of the most frequent name words and
+    `word_masks[i]` ORs together the bits of row `i`'s words (official and
+    alternate), so word-subset queries over those words reduce to one
+    integer AND per row. Both are empty when no word index has been built.
+
+    `index_words` is the sorted vocabulary of an inverted word index: the
+    rows containing `index_words[k]` are
+    `index_postings[index_offsets[k]:index_offsets[k + 1]]`, in cache order.
+    All three are empty when no index has been built.
+
+    `word_sets[i]` is the frozenset of row `i`'s words (official and
+    alternate) for word-subset queries that neither the masks nor the index
+    can answer. It is filled at build time, or on first use for a cache
+    loaded from disk.
+
+    `alternate_rows` pairs the indices of rows that have an alternate name
+    with those names, so alternates can be scored without visiting the
+    empty rows; it is derived on first use.
+
+    `length_rows[n]` lists, in cache order, the rows whose normalized name
+    or alternate name is `n` characters long, so length-bounded scorers only
+    visit the rows that can reach a threshold; it is derived on first use.
+
+    `corpus` joins every normalized name and alternate name with newlines
+    (row `i` is lines `2 * i` and `2 * i + 1`), so a substring query is one
+    `str.find` scan over the whole cache; it is derived on first use.
+
+    `fuzzy_memo` keeps the most recent fuzzy result lists of this cache,
+    keyed by query and scoring parameters; it lives and dies with the cache.
+    None of the derived fields is copied by `dataclasses.replace()`.
+    """
+
+    code_points: array[int]
+    names: list[str]
+    normalized: list[str]
+    alt_normalized: list[str]
+    word_bits: dict[str, int] = field(default_factory=dict)
+    word_masks: array[int] = field(default_factory=lambda: array("Q"))
+    index_words: list[str] = field(default_factory=list)
+    index_offsets: array[int] = field(default_factory=lambda: array("I"))
+    index_postings: array[int] = field(default_factory=lambda: array("I"))
+    word_sets: list[frozenset[str]] = field(
+        default_factory=list, init=False, compare=False, repr=False
+    )
+    alternate_rows: tuple[array[int], list[str]] | None = field(
+        default=None, init=False, compare=False, repr=False
+    )
+    length_rows: dict[int, array[int]] | None = field(
+        default=None, init=False, compare=False, repr=False
+    )
+    corpus: str | None = field(default=None, init=False, compare=False, repr=False)
+    fuzzy_memo: OrderedDict[FuzzyMemoKey, list[MatchRow]] = field(
+        default_factory=OrderedDict, init=False, compare=False, repr=False
+    )
+
+    def __len__(self) -> int:
+        return len(self.code_points)
+
+
+@dataclass(frozen=True, slots=True)
 class SearchConfig:
     fuzzy: bool
     threshold: float
-    name_cache: dict[str, dict[str, str]] | None
+    name_cache: NameCache | None
     verbose: bool
     use_color: bool
     fuzzy_algo: FuzzyAlgorithm
@@ -57,6 +139,14 @@ class SearchConfig:
 
 
 class CharMatch(TypedDict):
+    """
+    One match as a JSON-ready record (see `find_chars_raw()`).
+
+    This stays a dict because it is what `json.dumps` serializes; matching
+    and table rendering pass `MatchRow` tuples instead and only build these
+    records for JSON output.
+    """
+
     code: str
     char: str
     name: str
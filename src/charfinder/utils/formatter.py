@@ -14,11 +14,14 @@ Color handling is provided via `colorama`.
 
 Functions:
     echo(): Write a formatted message to terminal and logger.
+    echo_lines(): Write several formatted messages with a single flush.
     log_optionally_echo(): Log a message and optionally echo to terminal.
     should_use_color(): Determine whether color output should be used.
     format_result_line(): Format a result line for CLI display.
     format_result_header(): Format the result table header and divider.
     format_result_row(): Format a single result row.
+    format_result_rows(): Format many result rows in one pass.
+    result_row_formatter(): Select the row formatter for a result table.
 
 Note:
     Color constants should be factored out to `logger_styles.py` in the future
@@ -31,37 +34,83 @@ Note:
 
 from __future__ import annotations
 
+import codecs
+import functools
+import logging
 import sys
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from types import MappingProxyType, ModuleType
 from typing import TextIO
 
-from colorama import Fore, Style, init
+import colorama
+from colorama import Fore, Style
 
 from charfinder.constants import FIELD_WIDTHS, VALID_LOG_METHODS
-from charfinder.utils.logger_helpers import suppress_console_logging
+from charfinder.utils.logger_helpers import CONSOLE_SUPPRESSED
 
 __all__ = [
     "echo",
+    "echo_lines",
     "format_result_header",
     "format_result_line",
     "format_result_row",
+    "format_result_rows",
     "log_optionally_echo",
+    "result_row_formatter",
     "should_use_color",
 ]
 
 
-# Initialize colorama once
-init(autoreset=True)
-
-# Windows: Ensure terminal handles UTF-8 output
-if sys.platform == "win32" and hasattr(sys.stdout, "reconfigure"):
+# Windows: Ensure terminal handles UTF-8 output. reconfigure() flushes and
+# rewraps the stream, so skip it when stdout already encodes UTF-8 (for
+# example under PYTHONUTF8=1, or when this module is imported twice).
+if (
+    sys.platform == "win32"
+    and hasattr(sys.stdout, "reconfigure")
+    and codecs.lookup(sys.stdout.encoding or "ascii").name != "utf-8"
+):
     sys.stdout.reconfigure(encoding="utf-8")
 
+# ---------------------------------------------------------------------
+# Result table templates (column widths baked in once)
+# ---------------------------------------------------------------------
+
+_COLUMNS = f"{{:<{FIELD_WIDTHS['code']}}} {{:<{FIELD_WIDTHS['char']}}} {{:<{FIELD_WIDTHS['name']}}}"
+_ROW_TEMPLATE = _COLUMNS + " {:>6.3f}"
+_ROW_TEMPLATE_NO_SCORE = _COLUMNS
+_HEADER_WITH_SCORE = _COLUMNS.format("CODE", "CHAR", "NAME") + " SCORE"
+_HEADER_NO_SCORE = _COLUMNS.format("CODE", "CHAR", "NAME").rstrip()
+# Header and divider lines, indexed by has_score.
+_HEADERS = (
+    (_HEADER_NO_SCORE, "-" * len(_HEADER_NO_SCORE)),
+    (_HEADER_WITH_SCORE, "-" * len(_HEADER_WITH_SCORE)),
+)
+
+RowFormatter = Callable[[int, str, str, float | None], str]
+
+ROW_LABEL_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=ROW_LABEL_CACHE_SIZE)
+def _fmt_labels(code: int, name: str) -> tuple[str, str]:
+    """
+    Return the `U+XXXX` label and the `NAME  (\\uxxxx)` column for a row.
+
+    Both strings are reused for rows printed again, so repeated or
+    overlapping result sets allocate nothing for these columns.
+    """
+    return f"U+{code:04X}", f"{name}  (\\u{code:04x})"
+
+
 # ---------------------------------------------------------------------
 # Color support utilities
 # ---------------------------------------------------------------------
 
 
+_RESULT_LINE_COLOR = Fore.YELLOW
+_RESET = Style.RESET_ALL
+
+
 def _color_wrap(msg: str, color: str, *, use_color: bool) -> str:
     """
     Apply color formatting to a message if requested.
@@ -75,7 +124,7 @@ def _color_wrap(msg: str, color: str, *, use_color: bool) -> str:
         The formatted message.
     """
     if use_color:
-        return f"{color}{msg}{Style.RESET_ALL}"
+        return f"{color}{msg}{_RESET}"
     return msg
 
 
@@ -89,24 +138,123 @@ def should_use_color(mode: str) -> bool:
     Returns:
         bool: True if color output should be used, False otherwise.
     """
-    if mode == "always":
-        return True
     if mode == "never":
         return False
     # auto mode — use color if stdout is a tty
-    return sys.stdout.isatty()
+    use_color = mode == "always" or _stream_is_tty(sys.stdout)
+    if use_color:
+        _init_colorama()
+    return use_color
+
+
+@functools.cache
+def _init_colorama() -> None:
+    """
+    Initialize colorama once, the first time color output is selected.
+
+    Only Windows consoles need colorama to translate ANSI sequences; other
+    terminals handle them natively, and wrapping their streams would only
+    rescan every write. Every colored string already ends with a reset, so
+    `autoreset` is not needed either.
+    """
+    if sys.platform == "win32":
+        colorama.init(autoreset=False)
+
+
+# isatty() results of the standard streams, keyed by their sys attribute name
+# and holding the stream itself, so a replaced stream is asked again and at
+# most two streams are ever kept alive.
+_STD_STREAM_TTY: dict[str, tuple[TextIO, bool]] = {}
+
+
+def _isatty(stream: TextIO) -> bool:
+    """Return whether `stream` is a terminal; a closed stream is not."""
+    try:
+        return stream.isatty()
+    except ValueError:
+        return False
+
+
+def _stream_is_tty(stream: TextIO) -> bool:
+    """
+    Return whether `stream` is a terminal.
+
+    Only `sys.stdout` and `sys.stderr` are cached, so StringIO objects and
+    capture buffers passed to `echo()` are never retained or allowed to
+    evict them; other streams are asked directly.
+    """
+    if stream is sys.stdout:
+        key = "stdout"
+    elif stream is sys.stderr:
+        key = "stderr"
+    else:
+        return _isatty(stream)
+    cached = _STD_STREAM_TTY.get(key)
+    if cached is not None and cached[0] is stream:
+        return cached[1]
+    is_tty = _isatty(stream)
+    _STD_STREAM_TTY[key] = (stream, is_tty)
+    return is_tty
+
+
+def _invalidate_color_cache() -> None:
+    """Forget cached terminal checks (for tests that patch `isatty`)."""
+    _STD_STREAM_TTY.clear()
 
 
 # ---------------------------------------------------------------------
 # Standard message formatters
 # ---------------------------------------------------------------------
 
+# Level of each log method, so disabled levels are skipped before entering
+# the logging machinery.
+_LOG_LEVELS = MappingProxyType(
+    {
+        "debug": logging.DEBUG,
+        "info": logging.INFO,
+        "warning": logging.WARNING,
+        "error": logging.ERROR,
+        "exception": logging.ERROR,
+    }
+)
+
+
+@functools.cache
+def _logger_setup() -> ModuleType:
+    """
+    Return the `logger_setup` module, importing it on first use.
+
+    It cannot be imported at module level (it imports this module), and an
+    import statement inside the echo helpers would run on every message.
+    `get_logger` is looked up on the module per call, so patching it works.
+    """
+    from charfinder.utils import logger_setup
+
+    return logger_setup
+
+
+# The most recent logger paired with its bound log methods, keyed by name.
+_log_dispatch_state: list[tuple[object, dict[str, Callable[..., object]]]] = []
+
+
+def _log_dispatch(logger: object) -> dict[str, Callable[..., object]]:
+    """
+    Return the logger's VALID_LOG_METHODS as bound methods keyed by name.
+
+    The table is rebuilt only when a different logger is passed in.
+    """
+    if _log_dispatch_state and _log_dispatch_state[0][0] is logger:
+        return _log_dispatch_state[0][1]
+    table = {method: getattr(logger, method) for method in VALID_LOG_METHODS}
+    _log_dispatch_state[:] = [(logger, table)]
+    return table
+
 
 def echo(
     msg: str,
     style: Callable[[str], str],
     *,
-    stream: TextIO = sys.stdout,
+    stream: TextIO | None = None,
     show: bool = True,
     log: bool = True,
     log_method: str | None = None,
@@ -117,7 +265,7 @@ def echo(
     Args:
         msg: The message text.
         style: The formatting function to apply.
-        stream: Output stream (default sys.stdout).
+        stream: Output stream (default: sys.stdout at call time).
         show: If True, print to terminal; if False, suppress terminal output.
         log: If True, log the message (requires log_method).
         log_method: If provided, log using the corresponding logger method.
@@ -125,28 +273,85 @@ def echo(
     Raises:
         ValueError: If log=True but log_method is not provided, or if log_method is invalid.
     """
-    from charfinder.utils.logger_setup import get_logger
-
-    logger = get_logger()
     styled = style(msg)
+    log_func = _resolve_log_func(log_method, log=log)
+    if log_func is not None:
+        # The message reaches the terminal through `show`, not the console handler.
+        log_func(msg, extra=CONSOLE_SUPPRESSED)
+
+    if show:
+        stream = sys.stdout if stream is None else stream
+        stream.write(styled + "\n")
+        # Terminals get each message immediately; pipes and files keep
+        # their buffering and are flushed by echo_lines() or at exit.
+        if _stream_is_tty(stream):
+            stream.flush()
+
 
+def echo_lines(
+    msgs: Iterable[str],
+    style: Callable[[str], str],
+    *,
+    stream: TextIO | None = None,
+    show: bool = True,
+    log: bool = False,
+    log_method: str | None = None,
+) -> None:
+    """
+    Write several formatted messages to stdout with a single write and flush.
+
+    Behaves like calling `echo()` once per message, but the styled lines are
+    joined and written in one go. Use it for multi-line output such as the
+    result table, where a flush per row would cost a syscall per match.
+
+    Args:
+        msgs: The message texts, one per line.
+        style: The formatting function to apply to each message.
+        stream: Output stream (default: sys.stdout at call time).
+        show: If True, print to terminal; if False, suppress terminal output.
+        log: If True, log each message (requires log_method).
+        log_method: If provided, log using the corresponding logger method.
+
+    Raises:
+        ValueError: If log=True but log_method is not provided, or if log_method is invalid.
+    """
+    msgs = list(msgs)
+    log_func = _resolve_log_func(log_method, log=log)
+    if log_func is not None:
+        for msg in msgs:
+            log_func(msg, extra=CONSOLE_SUPPRESSED)
+
+    if show and msgs:
+        stream = sys.stdout if stream is None else stream
+        stream.write("".join([style(msg) + "\n" for msg in msgs]))
+        stream.flush()
+
+
+def _resolve_log_func(log_method: str | None, *, log: bool) -> Callable[..., object] | None:
+    """
+    Validate the logging arguments of `echo()` and return the method to call.
+
+    Returns:
+        The bound logger method, or None when nothing should be logged
+        (log=False, or the logger is not enabled for the method's level).
+
+    Raises:
+        ValueError: If log=True but log_method is not provided, or if log_method is invalid.
+    """
     if log and not log_method:
         msg_error = "log_method must be provided if log=True"
         raise ValueError(msg_error)
 
-    if log_method and log_method not in VALID_LOG_METHODS:
+    if not log_method:
+        return None
+    logger = _logger_setup().get_logger()
+    log_func = _log_dispatch(logger).get(log_method)
+    if log_func is None:
         msg_error = f"Invalid log_method: {log_method}"
         raise ValueError(msg_error)
-
-    log_func = getattr(logger, log_method, None) if log_method else None
-    if log and callable(log_func):
-        with suppress_console_logging():
-            log_func(msg)
-
-    if show:
-        with suppress_console_logging():
-            stream.write(styled + "\n")
-            stream.flush()
+    if not log or not logger.isEnabledFor(_LOG_LEVELS[log_method]):
+        return None
+    return log_func
 
 
 def log_optionally_echo(
@@ -155,7 +360,7 @@ def log_optionally_echo(
     *,
     show: bool = False,
     style: Callable[[str], str] | None = None,
-    stream: TextIO = sys.stdout,
+    stream: TextIO | None = None,
 ) -> None:
     """
     Log the message and optionally echo it to terminal.
@@ -165,21 +370,23 @@ def log_optionally_echo(
         level: 'info', 'warning', 'error', 'debug', 'exception'.
         show: If True, print to terminal.
         style: Optional style function for terminal output.
-        stream: Output stream for terminal (default sys.stdout).
+        stream: Output stream for terminal (default: sys.stdout at call time).
     """
-    from charfinder.utils.logger_setup import get_logger
-
-    logger = get_logger()
-    log_func = getattr(logger, level, None)
-    if callable(log_func):
-        with suppress_console_logging():
-            log_func(msg)
+    logger = _logger_setup().get_logger()
+    levelno = _LOG_LEVELS.get(level)
+    if levelno is None:
+        # Not one of VALID_LOG_METHODS: resolve it the slow way.
+        log_func = getattr(logger, level, None)
+        if callable(log_func):
+            log_func(msg, extra=CONSOLE_SUPPRESSED)
+    elif logger.isEnabledFor(levelno):
+        _log_dispatch(logger)[level](msg, extra=CONSOLE_SUPPRESSED)
 
     if show:
         styled = style(msg) if style else msg
-        with suppress_console_logging():
-            stream.write(styled + "\n")
-            stream.flush()
+        stream = sys.stdout if stream is None else stream
+        stream.write(styled + "\n")
+        stream.flush()
 
 
 # ---------------------------------------------------------------------
@@ -198,33 +405,24 @@ def format_result_line(line: str, *, use_color: bool = False) -> str:
     Returns:
         str: The formatted result line.
     """
+    # Inlined `_color_wrap()`: this runs once per printed result row.
+    return f"{_RESULT_LINE_COLOR}{line}{_RESET}" if use_color else line
 
-    return _color_wrap(line, Fore.YELLOW, use_color=use_color)
 
-
-def format_result_header(*, has_score: bool) -> list[str]:
+def format_result_header(*, has_score: bool) -> tuple[str, str]:
     """
     Format the result table header and divider.
 
+    Both variants are built at import time; the same tuple is returned on
+    every call.
+
     Args:
         has_score: Whether the results include a score column.
 
     Returns:
-        list[str]: A list of two strings: header line and divider line.
-    """
-    if has_score:
-        header = (
-            f"{'CODE':<{FIELD_WIDTHS['code']}} "
-            f"{'CHAR':<{FIELD_WIDTHS['char']}} "
-            f"{'NAME':<{FIELD_WIDTHS['name']}} "
-            "SCORE"
-        )
-    else:
-        header = f"{'CODE':<{FIELD_WIDTHS['code']}} {'CHAR':<{FIELD_WIDTHS['char']}} NAME"
-
-    divider = "-" * len(header)
-
-    return [header, divider]
+        tuple[str, str]: The header line and the divider line.
+    """
+    return _HEADERS[has_score]
 
 
 def format_result_row(code: int, char: str, name: str, score: float | None) -> str:
@@ -240,13 +438,59 @@ def format_result_row(code: int, char: str, name: str, score: float | None) -> s
     Returns:
         A formatted string representing the result row.
     """
-    code_str = f"U+{code:04X}"
-    name_str = f"{name}  (\\u{code:04x})"
-    score_str = f"{score:>6.3f}" if score is not None else ""
+    code_str, name_str = _fmt_labels(code, name)
+    if score is None:
+        return _ROW_TEMPLATE_NO_SCORE.format(code_str, char, name_str).rstrip()
+    return _ROW_TEMPLATE.format(code_str, char, name_str, score)
+
+
+def format_result_rows(rows: Iterable[tuple[int, str, str, float | None]]) -> list[str]:
+    """
+    Format many result rows at once.
 
-    return (
-        f"{code_str:<{FIELD_WIDTHS['code']}} "
-        f"{char:<{FIELD_WIDTHS['char']}} "
-        f"{name_str:<{FIELD_WIDTHS['name']}} "
-        f"{score_str}".rstrip()
-    )
+    Produces the same lines as calling `format_result_row()` per row, but
+    binds the templates and helpers once and runs the loop in a single
+    frame, which roughly halves the per-row cost for large result sets.
+
+    Args:
+        rows: `(code, char, name, score)` tuples; score may be None per row.
+
+    Returns:
+        list[str]: One formatted line per row.
+    """
+    with_score = _ROW_TEMPLATE.format
+    no_score = _ROW_TEMPLATE_NO_SCORE.format
+    fmt_labels = _fmt_labels
+    lines: list[str] = []
+    append = lines.append
+    for code, char, name, score in rows:
+        code_str, name_str = fmt_labels(code, name)
+        if score is None:
+            append(no_score(code_str, char, name_str).rstrip())
+        else:
+            append(with_score(code_str, char, name_str, score))
+    return lines
+
+
+def _format_scored_row(code: int, char: str, name: str, score: float | None) -> str:
+    """Format a row known to carry a score, skipping the None check."""
+    code_str, name_str = _fmt_labels(code, name)
+    return _ROW_TEMPLATE.format(code_str, char, name_str, score)
+
+
+def result_row_formatter(*, has_score: bool) -> RowFormatter:
+    """
+    Select a row formatter once for a whole result table.
+
+    Scored tables hold fuzzy matches only, so every row takes the scored
+    template. A table without a score header starts with exact matches and
+    may be followed by scored fuzzy matches (prefer-fuzzy mode), so it keeps
+    the general `format_result_row()`.
+
+    Args:
+        has_score: Whether the table header includes the score column.
+
+    Returns:
+        A callable with the signature of `format_result_row()`.
+    """
+    return _format_scored_row if has_score else format_result_row
@@ -9,6 +9,9 @@ Classes:
         charfinder.log → charfinder_1.log, charfinder_2.log, etc.
     StreamFilter: Filter that disables StreamHandler output when suppression is active.
 
+Constants:
+    CONSOLE_SUPPRESSED: `extra` mapping that keeps a single record off the console.
+
 Functions:
     suppress_console_logging():
         Context manager to temporarily suppress StreamHandler (console) output.
@@ -21,15 +24,17 @@ Functions:
 from __future__ import annotations
 
 import logging
-import re
-import threading
-from collections.abc import Iterator
+import os
+from collections.abc import Iterator, Mapping
 from contextlib import contextmanager, suppress
+from contextvars import ContextVar
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from typing import Literal
+from types import MappingProxyType
+from typing import Final, Literal
 
 __all__ = [
+    "CONSOLE_SUPPRESSED",
     "CustomRotatingFileHandler",
     "EnvironmentFilter",
     "SafeFormatter",
@@ -43,29 +48,38 @@ __all__ = [
 # ---------------------------------------------------------------------
 
 
-_SUPPRESS_CONSOLE_OUTPUT = threading.local()
-_SUPPRESS_CONSOLE_OUTPUT.value = False
+# Per-thread (and per-task) flag; a ContextVar reads and writes faster than
+# a threading.local attribute.
+_SUPPRESS_CONSOLE_OUTPUT: ContextVar[bool] = ContextVar(
+    "charfinder_suppress_console_output", default=False
+)
+
+# Pass as `extra=` to keep one record off the console. Cheaper than entering
+# `suppress_console_logging()` around a single call, e.g. for messages that
+# `echo()` already writes to the terminal itself.
+CONSOLE_SUPPRESSED: Final[Mapping[str, object]] = MappingProxyType({"suppress_console": True})
 
 
 class StreamFilter(logging.Filter):
     """Filter that disables StreamHandler output if suppression is active."""
 
-    def filter(self, _record: logging.LogRecord) -> bool:
-        return not getattr(_SUPPRESS_CONSOLE_OUTPUT, "value", False)
+    def filter(self, record: logging.LogRecord) -> bool:
+        return not (
+            _SUPPRESS_CONSOLE_OUTPUT.get() or record.__dict__.get("suppress_console", False)
+        )
 
 
 @contextmanager
 def suppress_console_logging() -> Iterator[None]:
     """
     Context manager to temporarily suppress StreamHandler (console) output.
-    Thread-safe version using global flag + StreamFilter.
+    Thread-safe version using a context-local flag + StreamFilter.
     """
-    old_value = getattr(_SUPPRESS_CONSOLE_OUTPUT, "value", False)
-    _SUPPRESS_CONSOLE_OUTPUT.value = True
+    token = _SUPPRESS_CONSOLE_OUTPUT.set(True)
     try:
         yield
     finally:
-        _SUPPRESS_CONSOLE_OUTPUT.value = old_value
+        _SUPPRESS_CONSOLE_OUTPUT.reset(token)
 
 
 # ---------------------------------------------------------------------
@@ -77,6 +91,11 @@ class EnvironmentFilter(logging.Filter):
     """Injects the current environment (e.g., DEV, UAT, PROD) into log records."""
 
     def filter(self, record: logging.LogRecord) -> bool:
+        # The console and file handlers share one filter instance, so each
+        # record passes through here twice; only the first pass does work.
+        if hasattr(record, "env"):
+            return True
+
         # Delayed import to avoid circular import issues
         from charfinder.settings import get_environment
 
@@ -141,17 +160,24 @@ class CustomRotatingFileHandler(RotatingFileHandler):
                 with suppress(OSError):
                     path.unlink()
 
+            # One directory scan replaces two exists() checks per backup slot.
+            current_log = Path(self.baseFilename)
+            with os.scandir(current_log.parent) as entries:
+                present = {entry.name for entry in entries}
+
             for i in range(self.backupCount - 1, 0, -1):
                 src = Path(self.rotation_filename(f"{self.baseFilename}.{i}"))
+                if src.name not in present:
+                    continue
                 dst = Path(self.rotation_filename(f"{self.baseFilename}.{i + 1}"))
-                if src.exists():
-                    if dst.exists():
-                        dst.unlink()
-                    src.rename(dst)
+                if dst.name in present:
+                    dst.unlink()
+                src.rename(dst)
+                present.discard(src.name)
+                present.add(dst.name)
 
             rollover_path = Path(self.rotation_filename(f"{self.baseFilename}.1"))
-            current_log = Path(self.baseFilename)
-            if current_log.exists():
+            if current_log.name in present:
                 current_log.rename(rollover_path)
 
         if not self.delay:
@@ -160,11 +186,23 @@ class CustomRotatingFileHandler(RotatingFileHandler):
     def get_files_to_delete(self) -> list[Path]:
         """Return list of rotated log files to delete to enforce backup count."""
         base_path = Path(self.baseFilename)
-        prefix = base_path.stem
+        prefix = f"{base_path.stem}_"
         ext = base_path.suffix
-        pattern = re.compile(rf"^{re.escape(prefix)}_(\d+){re.escape(ext)}$")
-
-        return sorted(
-            [p for p in base_path.parent.iterdir() if pattern.match(p.name)],
-            key=lambda p: p.stat().st_mtime,
-        )[: -self.backupCount]
+        start = len(prefix)
+        min_len = start + len(ext)
+
+        # Rotated files are named "<stem>_<n><ext>"; DirEntry names are
+        # filtered directly and only the returned entries become Paths.
+        with os.scandir(base_path.parent) as entries:
+            rotated = sorted(
+                [
+                    entry
+                    for entry in entries
+                    if (name := entry.name).startswith(prefix)
+                    and name.endswith(ext)
+                    and len(name) > min_len
+                    and name[start : len(name) - len(ext)].isdecimal()
+                ],
+                key=lambda entry: entry.stat().st_mtime,
+            )
+        return [Path(entry.path) for entry in rotated[: -self.backupCount]]
@@ -59,6 +59,10 @@ __all__ = [
 
 LOGGER_NAME = "charfinder"
 
+# logging.getLogger() takes the module-level logging lock on every call;
+# the project logger never changes, so look it up once.
+_LOGGER = logging.getLogger(LOGGER_NAME)
+
 # ---------------------------------------------------------------------
 # Logger Access Functions
 # ---------------------------------------------------------------------
@@ -66,7 +70,7 @@ LOGGER_NAME = "charfinder"
 
 def get_logger() -> logging.Logger:
     """Return the central project logger."""
-    return logging.getLogger(LOGGER_NAME)
+    return _LOGGER
 
 
 def ensure_filter(handler: logging.Handler, filt: logging.Filter) -> None:
@@ -120,11 +124,15 @@ def setup_logging(  # noqa: PLR0913
         teardown_logger(logger)
 
     # Idempotent protection:
-    # Check if already correctly configured
-    existing_handler_types = {type(h) for h in logger.handlers}
-    expected_handler_types = {logging.StreamHandler, CustomRotatingFileHandler}
-
-    if existing_handler_types == expected_handler_types and not reset:
+    # Check if already correctly configured (handlers in the order added below;
+    # exact types, since the file handler is itself a StreamHandler subclass)
+    handlers = logger.handlers
+    if (
+        not reset
+        and len(handlers) == 2  # noqa: PLR2004
+        and type(handlers[0]) is logging.StreamHandler
+        and type(handlers[1]) is CustomRotatingFileHandler
+    ):
         return None  # Already configured — skip re-setup
 
     # Clean existing if partial config detected
@@ -51,6 +51,23 @@ COLOR_DEBUG: Final = Fore.LIGHTBLACK_EX
 COLOR_SETTINGS: Final = Fore.LIGHTBLACK_EX
 RESET: Final = Style.RESET_ALL
 
+# ----------------------------------------------------------------------
+# Message prefixes (assembled once, with and without color)
+# ----------------------------------------------------------------------
+
+_PREFIX_DEBUG_COLOR: Final = f"{COLOR_DEBUG}[DEBUG]{RESET} "
+_PREFIX_DEBUG_PLAIN: Final = "[DEBUG] "
+_PREFIX_INFO_COLOR: Final = f"{COLOR_INFO}[INFO]{RESET} "
+_PREFIX_INFO_PLAIN: Final = "[INFO] "
+_PREFIX_WARNING_COLOR: Final = f"{COLOR_WARNING}[WARNING]{RESET} "
+_PREFIX_WARNING_PLAIN: Final = "[WARNING] "
+_PREFIX_ERROR_COLOR: Final = f"{COLOR_ERROR}[ERROR]{RESET} "
+_PREFIX_ERROR_PLAIN: Final = "[ERROR] "
+_PREFIX_SETTINGS_COLOR: Final = f"{COLOR_SETTINGS}[SETTINGS]{RESET} "
+_PREFIX_SETTINGS_PLAIN: Final = "[SETTINGS] "
+_PREFIX_SUCCESS_COLOR: Final = f"{COLOR_SUCCESS}[OK]{RESET} "
+_PREFIX_SUCCESS_PLAIN: Final = "[OK] "
+
 # ----------------------------------------------------------------------
 # Formatting functions
 # ----------------------------------------------------------------------
@@ -58,35 +75,29 @@ RESET: Final = Style.RESET_ALL
 
 def format_debug(message: str, *, use_color: bool = True) -> str:
     """Format debug message with [DEBUG] prefix."""
-    prefix = f"{COLOR_DEBUG}[DEBUG]{RESET}" if use_color else "[DEBUG]"
-    return f"{prefix} {message}"
+    return (_PREFIX_DEBUG_COLOR if use_color else _PREFIX_DEBUG_PLAIN) + message
 
 
 def format_info(message: str, *, use_color: bool = True) -> str:
     """Format info message with [INFO] prefix."""
-    prefix = f"{COLOR_INFO}[INFO]{RESET}" if use_color else "[INFO]"
-    return f"{prefix} {message}"
+    return (_PREFIX_INFO_COLOR if use_color else _PREFIX_INFO_PLAIN) + message
 
 
 def format_warning(message: str, *, use_color: bool = True) -> str:
     """Format warning message with [WARNING] prefix."""
-    prefix = f"{COLOR_WARNING}[WARNING]{RESET}" if use_color else "[WARNING]"
-    return f"{prefix} {message}"
+    return (_PREFIX_WARNING_COLOR if use_color else _PREFIX_WARNING_PLAIN) + message
 
 
 def format_error(message: str, *, use_color: bool = True) -> str:
     """Format error message with [ERROR] prefix."""
-    prefix = f"{COLOR_ERROR}[ERROR]{RESET}" if use_color else "[ERROR]"
-    return f"{prefix} {message}"
+    return (_PREFIX_ERROR_COLOR if use_color else _PREFIX_ERROR_PLAIN) + message
 
 
 def format_settings(message: str, *, use_color: bool = True) -> str:
     """Format settings message with [SETTINGS] prefix."""
-    prefix = f"{COLOR_SETTINGS}[SETTINGS]{RESET}" if use_color else "[SETTINGS]"
-    return f"{prefix} {message}"
+    return (_PREFIX_SETTINGS_COLOR if use_color else _PREFIX_SETTINGS_PLAIN) + message
 
 
 def format_success(message: str, *, use_color: bool = True) -> str:
     """Format success message with [OK] prefix."""
-    prefix = f"{COLOR_SUCCESS}[OK]{RESET}" if use_color else "[OK]"
-    return f"{prefix} {message}"
+    return (_PREFIX_SUCCESS_COLOR if use_color else _PREFIX_SUCCESS_PLAIN) + message
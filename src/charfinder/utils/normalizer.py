@@ -5,21 +5,31 @@ and uppercase conversion, for consistent matching and comparison.
 
 Functions:
     normalize(): Normalize input text with configured Unicode normalization form.
+    clear_normalize_cache(): Drop the memoized non-ASCII normalizations.
+
+Constants:
+    NORMALIZE_CACHE_SIZE: Number of non-ASCII inputs memoized by normalize().
 """
 
 # ---------------------------------------------------------------------
 # Imports
 # ---------------------------------------------------------------------
 
+import functools
 import unicodedata
 
 from charfinder.constants import DEFAULT_NORMALIZATION_FORM
 from charfinder.utils.logger_setup import get_logger
 
-__all__ = ["normalize"]
+__all__ = ["NORMALIZE_CACHE_SIZE", "clear_normalize_cache", "normalize"]
 
 logger = get_logger()
 
+# Non-ASCII inputs memoized by normalize(). ASCII text is not cached: its
+# fast path is cheaper than a cache lookup, and the ~140k character names
+# normalized while building the name cache would only evict each other.
+NORMALIZE_CACHE_SIZE = 4096
+
 # ---------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------
@@ -27,7 +37,12 @@ logger = get_logger()
 
 def normalize(text: str) -> str:
     """
-    Normalize the input text using Unicode NFKD normalization and convert to uppercase.
+    Normalize the input text with the configured Unicode form and convert to uppercase.
+
+    ASCII text is invariant under every Unicode normalization form, so it
+    skips `unicodedata.normalize()` and is only uppercased. Unicode character
+    names are pure ASCII, which makes this the common path. Other text is
+    memoized (see NORMALIZE_CACHE_SIZE).
 
     Args:
         text: Input text.
@@ -35,4 +50,19 @@ def normalize(text: str) -> str:
     Returns:
         str: Normalized and uppercased text.
     """
+    if text.isascii():
+        return text.upper()
+    return _normalize_non_ascii(text)
+
+
+@functools.lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize_non_ascii(text: str) -> str:
+    # No explicit `unicodedata.is_normalized()` guard: `normalize()` runs the
+    # same quick check first and returns already-normalized input as is, so a
+    # separate check would only scan the text twice.
     return unicodedata.normalize(DEFAULT_NORMALIZATION_FORM, text).upper()
+
+
+def clear_normalize_cache() -> None:
+    """Drop the non-ASCII normalizations memoized by normalize()."""
+    _normalize_non_ascii.cache_clear()
@@ -23,6 +23,7 @@ from typing import TYPE_CHECKING, Final
 
 import pytest
 
+from charfinder.utils.formatter import _invalidate_color_cache
 from charfinder.utils.logger_setup import get_logger, teardown_logger
 from tests.helpers.conftest_helpers import invoke_cli
 
@@ -50,6 +51,18 @@ def clean_charfinder_logger() -> Generator[None, None, None]:
     yield
     teardown_logger(logger)
 
+# ---------------------------------------------------------------------
+# Color Detection Isolation
+# ---------------------------------------------------------------------
+
+@pytest.fixture(autouse=True)
+def clear_color_cache() -> None:
+    """
+    Forget cached isatty() checks so a stream patched by one test
+    does not decide color output for the next.
+    """
+    _invalidate_color_cache()
+
 # ---------------------------------------------------------------------
 # Environment Cleanup
 # ---------------------------------------------------------------------
@@ -57,7 +70,8 @@ def clean_charfinder_logger() -> Generator[None, None, None]:
 @pytest.fixture(autouse=True)
 def clear_charfinder_env(monkeypatch: MonkeyPatch) -> None:
     """
-    Clears all CHARFINDER-related env vars before each test to ensure test isolation.
+    Clears all CHARFINDER-related env vars before each test to ensure test isolation,
+    then drops the settings memoized from the previous test's environment.
     """
     for var in [
         "CHARFINDER_ENV",
@@ -70,6 +84,9 @@ def clear_charfinder_env(monkeypatch: MonkeyPatch) -> None:
 
     monkeypatch.setenv("CHARFINDER_DEBUG_ENV_LOAD", "0")
 
+    import charfinder.settings as sett
+    sett.clear_settings_cache()
+
 # ---------------------------------------------------------------------
 # Settings Reload (with optional .env)
 # ---------------------------------------------------------------------
@@ -126,6 +143,9 @@ def patch_env(monkeypatch: MonkeyPatch) -> Callable[[str], None]:
     def _patch(env_name: str) -> None:
         monkeypatch.setenv("CHARFINDER_ENV", env_name)
 
+        import charfinder.settings as sett
+        sett.clear_settings_cache()
+
     return _patch
 
 # ---------------------------------------------------------------------
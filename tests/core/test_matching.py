@@ -0,0 +1,110 @@
+"""
+Unit tests for charfinder.core.matching.
+
+Covers:
+- Word-subset matching through word masks, the word index and word sets
+- Substring matching through the joined name corpus
+- Memoization of fuzzy results on the name cache
+"""
+
+from __future__ import annotations
+
+from array import array
+
+import pytest
+
+from charfinder.constants import FuzzyAlgorithm
+from charfinder.core import matching
+from charfinder.core import name_cache as nc
+from charfinder.types import FuzzyMatchContext, NameCache
+
+
+@pytest.fixture
+def small_cache() -> NameCache:
+    return NameCache(
+        code_points=array("I", [0x41, 0x2603]),
+        names=["LATIN CAPITAL LETTER A", "SNOWMAN"],
+        normalized=["LATIN CAPITAL LETTER A", "SNOWMAN"],
+        alt_normalized=["", "SNOW MAN"],
+    )
+
+
+def _indexed(cache: NameCache) -> NameCache:
+    nc._build_word_masks(cache)
+    nc._build_word_index(cache)
+    return cache
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("SNOW MAN", ["SNOWMAN"]),
+        ("LETTER LATIN", ["LATIN CAPITAL LETTER A"]),
+        ("SNOW LETTER", []),
+        ("SNOWBALL", []),
+    ],
+)
+def test_word_subset_matches_official_and_alternate_words(
+    small_cache: NameCache, indexed: bool, query: str, expected: list[str]
+) -> None:
+    cache = _indexed(small_cache) if indexed else small_cache
+    matches = matching.find_exact_matches(query, cache, "word-subset")
+    assert [row[2] for row in matches] == expected
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("SNOW", ["SNOWMAN"]),
+        ("W M", ["SNOWMAN"]),
+        ("A", ["LATIN CAPITAL LETTER A", "SNOWMAN"]),
+        ("A\nS", []),
+        ("MAN\nSNOW", []),
+    ],
+)
+def test_substring_matches_do_not_span_names(
+    small_cache: NameCache, query: str, expected: list[str]
+) -> None:
+    matches = matching.find_exact_matches(query, small_cache, "substring")
+    assert [row[2] for row in matches] == expected
+
+
+def test_unknown_exact_match_mode_is_rejected(small_cache: NameCache) -> None:
+    with pytest.raises(ValueError, match="Unknown exact match mode"):
+        list(matching.find_exact_matches("SNOW", small_cache, "prefix"))
+
+
+def _context(fuzzy_algo: FuzzyAlgorithm) -> FuzzyMatchContext:
+    return FuzzyMatchContext(
+        threshold=0.7,
+        fuzzy_algo=fuzzy_algo,
+        match_mode="single",
+        agg_fn="mean",
+        verbose=False,
+        use_color=False,
+        query="snowmen",
+    )
+
+
+@pytest.mark.parametrize("fuzzy_algo", ["token_sort_ratio", "sequencematcher"])
+def test_fuzzy_results_are_memoized(
+    monkeypatch: pytest.MonkeyPatch, small_cache: NameCache, fuzzy_algo: FuzzyAlgorithm
+) -> None:
+    first = list(matching.find_fuzzy_matches("SNOWMEN", small_cache, _context(fuzzy_algo)))
+    assert [row[2] for row in first] == ["SNOWMAN"]
+
+    def fail(*_args: object, **_kwargs: object) -> None:
+        message = "memoized query was rescored"
+        raise AssertionError(message)
+
+    monkeypatch.setattr(matching, "_find_fuzzy_matches_bulk", fail)
+    monkeypatch.setattr(matching, "_find_fuzzy_matches_per_pair", fail)
+    assert list(matching.find_fuzzy_matches("SNOWMEN", small_cache, _context(fuzzy_algo))) == first
+
+
+def test_partially_consumed_fuzzy_results_are_not_memoized(small_cache: NameCache) -> None:
+    matches = matching.find_fuzzy_matches("SNOWMEN", small_cache, _context("sequencematcher"))
+    next(matches)
+    matches.close()
+    assert not small_cache.fuzzy_memo
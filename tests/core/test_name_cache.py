@@ -0,0 +1,198 @@
+"""
+Unit tests for charfinder.core.name_cache.
+
+Covers:
+- Columnar pickled payload round-trip
+- Code point ranges skipped by the build scan
+- Scanned names being ready for prepared fuzzy scoring
+- Word masks and the inverted word index
+- Rows bucketed by name length
+- Rejection of legacy / outdated cache payloads (format and UCD version)
+- Corrupt cache files and atomic cache writes
+- Detecting a UnicodeData.txt from another Unicode version
+- Loading a persisted cache without rebuilding
+- In-process memoization of loaded caches
+"""
+
+from __future__ import annotations
+
+import pickle
+import sys
+import unicodedata
+from array import array
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from charfinder.core import name_cache as nc
+from charfinder.types import NameCache
+
+
+@pytest.fixture
+def small_cache() -> NameCache:
+    cache = NameCache(
+        code_points=array("I", [0x41, 0x2603]),
+        names=["LATIN CAPITAL LETTER A", "SNOWMAN"],
+        normalized=["LATIN CAPITAL LETTER A", "SNOWMAN"],
+        alt_normalized=["", "SNOW MAN"],
+    )
+    nc._build_word_masks(cache)
+    nc._build_word_index(cache)
+    return cache
+
+
+# ---------------------------------------------------------------------
+# Payload conversion
+# ---------------------------------------------------------------------
+
+
+def test_payload_round_trip(small_cache: NameCache) -> None:
+    payload = pickle.loads(pickle.dumps(nc._cache_to_payload(small_cache), protocol=5))
+    assert nc._cache_from_payload(payload) == small_cache
+
+
+def test_legacy_payload_is_rejected() -> None:
+    legacy = {"A": {"original": "LATIN CAPITAL LETTER A", "normalized": "LATIN CAPITAL LETTER A"}}
+    assert nc._cache_from_payload(legacy) is None
+
+
+def test_payload_from_other_unicode_version_is_rejected(small_cache: NameCache) -> None:
+    payload = nc._cache_to_payload(small_cache)
+    payload["unidata_version"] = "0.0.0"
+    assert nc._cache_from_payload(payload) is None
+
+
+@pytest.mark.parametrize(
+    "make_content",
+    [
+        lambda _payload: b"\x80\x09junk",
+        lambda _payload: b"\x80\x05",
+        lambda payload: pickle.dumps({k: v for k, v in payload.items() if k != "names"}),
+    ],
+)
+def test_corrupt_cache_file_is_treated_as_outdated(
+    tmp_path: Path, small_cache: NameCache, make_content: Callable[[dict[str, object]], bytes]
+) -> None:
+    cache_file = tmp_path / "cache.pkl"
+    cache_file.write_bytes(make_content(nc._cache_to_payload(small_cache)))
+    assert nc._load_cache(cache_file, show=False, use_color=False) is None
+
+
+def test_written_cache_leaves_no_partial_file(tmp_path: Path, small_cache: NameCache) -> None:
+    cache_file = tmp_path / "cache" / "cache.pkl"
+    nc._write_cache(small_cache, cache_file)
+
+    assert list(cache_file.parent.iterdir()) == [cache_file]
+    assert nc._load_cache(cache_file, show=False, use_color=False) == small_cache
+
+
+def test_word_masks_cover_official_and_alternate_words(small_cache: NameCache) -> None:
+    bits = small_cache.word_bits
+    snow_mask = bits["SNOW"] | bits["MAN"] | bits["SNOWMAN"]
+    assert small_cache.word_masks[1] == snow_mask
+    assert small_cache.word_masks[0] & snow_mask == 0
+
+
+def test_word_index_maps_words_to_rows(small_cache: NameCache) -> None:
+    def rows(word: str) -> list[int]:
+        k = small_cache.index_words.index(word)
+        offsets = small_cache.index_offsets
+        return list(small_cache.index_postings[offsets[k] : offsets[k + 1]])
+
+    assert small_cache.index_words == sorted(small_cache.index_words)
+    assert rows("LETTER") == [0]
+    assert rows("SNOW") == [1]
+    assert rows("SNOWMAN") == [1]
+
+
+def test_length_rows_cover_official_and_alternate_names(small_cache: NameCache) -> None:
+    assert nc.get_length_rows(small_cache) == {22: array("I", [0]), 7: array("I", [1]), 8: array("I", [1])}
+
+
+def test_skipped_code_points_have_no_names() -> None:
+    starts = [start for start, _ in nc.NAMED_CODE_POINT_RANGES] + [sys.maxunicode + 1]
+    stops = [0] + [stop for _, stop in nc.NAMED_CODE_POINT_RANGES]
+    for gap_start, gap_stop in zip(stops, starts, strict=True):
+        assert not any(unicodedata.name(chr(code), "") for code in range(gap_start, gap_stop))
+
+
+def test_scanned_names_are_prenormalized() -> None:
+    _, _, normalized = nc._scan_code_points((0x20, 0x3000))
+    assert all(name == name.strip().upper() for name in normalized)
+
+
+def test_names_from_other_unicode_versions_are_rejected() -> None:
+    runtime_names = {
+        chr(code): name
+        for code_points, names, _ in nc._scan_all_code_points(1)
+        for code, name in zip(code_points, names, strict=True)
+    }
+    assert nc._names_match_runtime(runtime_names)
+
+    plane_1_top = max(char for char in runtime_names if ord(char) < 0x20000)
+
+    older = dict(runtime_names)
+    del older[plane_1_top]
+    assert not nc._names_match_runtime(older)
+
+    newer = dict(runtime_names)
+    newer[chr(ord(plane_1_top) + 1)] = "CHARACTER FROM A LATER VERSION"
+    newer = dict(sorted(newer.items()))
+    assert not nc._names_match_runtime(newer)
+
+    renamed = {**runtime_names, plane_1_top: "RENAMED CHARACTER"}
+    assert not nc._names_match_runtime(renamed)
+
+
+# ---------------------------------------------------------------------
+# build_name_cache
+# ---------------------------------------------------------------------
+
+
+def test_mismatched_unicode_data_falls_back_to_scan(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(
+        nc,
+        "load_unicode_names",
+        lambda **_: ({"A": "LATIN LETTER A"}, {"\n": "LINE FEED (LF)"}),
+    )
+    monkeypatch.setattr(
+        nc,
+        "_scan_all_code_points",
+        lambda _workers: [
+            (
+                [0x0A, 0x41],
+                ["LINE FEED", "LATIN CAPITAL LETTER A"],
+                ["LINE FEED", "LATIN CAPITAL LETTER A"],
+            )
+        ],
+    )
+
+    cache = nc.build_name_cache(
+        force_rebuild=True, show=False, cache_file_path=tmp_path / "cache.pkl"
+    )
+
+    assert cache.names == ["LINE FEED", "LATIN CAPITAL LETTER A"]
+    assert cache.alt_normalized == ["LINE FEED (LF)", ""]
+
+
+def test_build_name_cache_loads_persisted_file(tmp_path: Path, small_cache: NameCache) -> None:
+    cache_file = tmp_path / "cache.pkl"
+    cache_file.write_bytes(pickle.dumps(nc._cache_to_payload(small_cache), protocol=5))
+
+    loaded = nc.build_name_cache(show=False, cache_file_path=cache_file)
+
+    assert loaded == small_cache
+
+
+def test_build_name_cache_is_memoized_per_path(tmp_path: Path, small_cache: NameCache) -> None:
+    cache_file = tmp_path / "cache.pkl"
+    cache_file.write_bytes(pickle.dumps(nc._cache_to_payload(small_cache), protocol=5))
+
+    first = nc.build_name_cache(show=False, cache_file_path=cache_file)
+    cache_file.unlink()
+    second = nc.build_name_cache(show=False, cache_file_path=cache_file)
+
+    assert second is first
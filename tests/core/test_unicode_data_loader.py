@@ -0,0 +1,67 @@
+"""
+Unit tests for charfinder.core.unicode_data_loader.
+
+Covers:
+- Streaming download into the local cache file
+- Parsing alternate names from a local UnicodeData.txt
+- Official names, including <..., First>/<..., Last> ranges
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from charfinder.core import unicode_data_loader as udl
+
+UNICODE_DATA = (
+    "000A;<control>;Cc;0;B;;;;;N;LINE FEED (LF);;;;\n"
+    "0041;LATIN CAPITAL LETTER A;Lu;0;L;;;;;N;;;;0061;\n"
+)
+
+
+@pytest.fixture
+def source_file(tmp_path: Path) -> Path:
+    path = tmp_path / "source.txt"
+    path.write_text(UNICODE_DATA, encoding="utf-8")
+    return path
+
+
+def test_download_is_streamed_to_local_file(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, source_file: Path
+) -> None:
+    target = tmp_path / "cache" / "UnicodeData.txt"
+    monkeypatch.setattr(udl, "get_unicode_data_url", lambda: source_file.as_uri())
+    monkeypatch.setattr(udl, "get_unicode_data_file", lambda: target)
+
+    assert udl.load_alternate_names(show=False) == {"\n": "LINE FEED (LF)"}
+    assert target.read_text(encoding="utf-8") == UNICODE_DATA
+    assert list(target.parent.iterdir()) == [target]
+
+
+def test_local_file_is_parsed(monkeypatch: pytest.MonkeyPatch, source_file: Path) -> None:
+    monkeypatch.setattr(udl, "get_unicode_data_url", lambda: "http://invalid.invalid/")
+    monkeypatch.setattr(udl, "get_unicode_data_file", lambda: source_file)
+
+    assert udl.load_alternate_names(show=False) == {"\n": "LINE FEED (LF)"}
+
+
+def test_official_names_expand_ranges() -> None:
+    lines = [
+        "0009;<control>;Cc;0;S;;;;;N;CHARACTER TABULATION;;;;\n",
+        "0041;LATIN CAPITAL LETTER A;Lu;0;L;;;;;N;;;;0061;\n",
+        "4E00;<CJK Ideograph, First>;Lo;0;L;;;;;N;;;;;\n",
+        "4E01;<CJK Ideograph, Last>;Lo;0;L;;;;;N;;;;;\n",
+        "E000;<Private Use, First>;Co;0;L;;;;;N;;;;;\n",
+        "F8FF;<Private Use, Last>;Co;0;L;;;;;N;;;;;\n",
+    ]
+
+    official, alternate = udl._parse_unicode_data(lines)
+
+    assert official == {
+        "A": "LATIN CAPITAL LETTER A",
+        "\u4e00": "CJK UNIFIED IDEOGRAPH-4E00",
+        "\u4e01": "CJK UNIFIED IDEOGRAPH-4E01",
+    }
+    assert alternate == {"\t": "CHARACTER TABULATION"}
@@ -36,6 +36,12 @@ def test_default_constants() -> None:
     assert C.DEFAULT_COLOR_MODE in get_args(C.ColorMode)
 
 
+def test_valid_input_sets_match_ordered_constants() -> None:
+    assert frozenset(C.VALID_FUZZY_MATCH_MODES) == C.VALID_FUZZY_MATCH_MODE_SET
+    assert frozenset(C.VALID_EXACT_MATCH_MODES) == C.VALID_EXACT_MATCH_MODE_SET
+    assert frozenset(get_args(C.VALID_HYBRID_AGG_FUNCS)) == C.VALID_HYBRID_AGG_FUNC_SET
+
+
 def test_logging_constants() -> None:
     assert isinstance(C.LOG_FILE_NAME, str)
     assert C.LOG_FILE_NAME.endswith(".log")
@@ -0,0 +1,114 @@
+"""
+Test fuzzymatchlib.py scoring entry points.
+
+Covers:
+- Algorithm name resolution
+- compute_similarity_bulk agreeing with per-pair compute_similarity
+- Score cutoffs in bulk scoring
+- Memoization of compute_similarity
+- Score cutoffs in hybrid_score and compute_similarity
+"""
+
+import pytest
+
+from charfinder import fuzzymatchlib
+from charfinder.fuzzymatchlib import (
+    compute_similarity,
+    compute_similarity_bulk,
+    resolve_algorithm_name,
+)
+
+CANDIDATES = [
+    "LATIN SMALL LETTER A",
+    " latin capital letter a ",
+    "GREEK SMALL LETTER ALPHA",
+    "SMALL LETTER LATIN A",
+    "",
+]
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("token_sort_ratio", "token_sort_ratio"),
+        ("Levenshtein", "levenshtein_ratio"),
+        ("SequenceMatcher", "sequencematcher"),
+        ("HYBRID", "hybrid_score"),
+    ],
+)
+def test_resolve_algorithm_name_accepts_names_and_aliases(name: str, expected: str) -> None:
+    assert resolve_algorithm_name(name) == expected
+
+
+def test_resolve_algorithm_name_rejects_unknown_names() -> None:
+    with pytest.raises(ValueError, match="Unknown fuzzy algorithm"):
+        resolve_algorithm_name("jaro")
+
+
+@pytest.mark.parametrize(
+    ("algorithm", "mode"),
+    [
+        ("rapidfuzz", "single"),
+        ("token_sort_ratio", "single"),
+        ("levenshtein", "single"),
+        ("sequencematcher", "single"),
+        ("simple_ratio", "single"),
+        ("hybrid_score", "hybrid"),
+    ],
+)
+def test_bulk_scores_match_per_pair_scores(algorithm: str, mode: str) -> None:
+    scores = compute_similarity_bulk("latin small letter a", CANDIDATES, algorithm, mode)  # type: ignore[arg-type]
+
+    assert list(scores) == list(range(len(CANDIDATES)))
+    for idx, candidate in enumerate(CANDIDATES):
+        expected = compute_similarity("latin small letter a", candidate, algorithm, mode)  # type: ignore[arg-type]
+        assert scores[idx] == pytest.approx(expected)
+
+
+def test_bulk_scores_respect_cutoff() -> None:
+    scores = compute_similarity_bulk(
+        "LATIN SMALL LETTER A", CANDIDATES, "levenshtein_ratio", score_cutoff=0.9
+    )
+
+    assert scores == {0: 1.0}
+
+
+def test_compute_similarity_memoizes_preprocessed_pairs() -> None:
+    fuzzymatchlib.clear_similarity_cache()
+    cache_info = fuzzymatchlib._compute_similarity_cached.cache_info
+
+    first = compute_similarity("latin a", "LATIN B", "levenshtein")
+    second = compute_similarity(" LATIN A ", "latin b", "levenshtein")
+
+    assert first == second
+    assert cache_info().hits == 1
+    assert cache_info().misses == 1
+
+
+CUTOFF = 0.6
+
+
+@pytest.mark.parametrize("agg_fn", ["mean", "median", "max", "min"])
+def test_hybrid_score_cutoff_only_hides_scores_below_it(agg_fn: str) -> None:
+    pairs = [(CANDIDATES[0], candidate.strip().upper()) for candidate in CANDIDATES]
+
+    for a, b in pairs:
+        exact = fuzzymatchlib.hybrid_score(a, b, agg_fn)  # type: ignore[arg-type]
+        cut = fuzzymatchlib.hybrid_score(a, b, agg_fn, score_cutoff=CUTOFF)  # type: ignore[arg-type]
+        if exact >= CUTOFF:
+            assert cut == exact
+        else:
+            assert cut in {exact, 0.0}
+
+
+@pytest.mark.parametrize(
+    "algorithm", ["sequencematcher", "simple_ratio", "rapidfuzz", "levenshtein"]
+)
+def test_compute_similarity_cutoff_only_hides_scores_below_it(algorithm: str) -> None:
+    for candidate in CANDIDATES:
+        exact = compute_similarity(CANDIDATES[0], candidate, algorithm)  # type: ignore[arg-type]
+        cut = compute_similarity(CANDIDATES[0], candidate, algorithm, score_cutoff=CUTOFF)  # type: ignore[arg-type]
+        if exact >= CUTOFF:
+            assert cut == exact
+        else:
+            assert cut in {exact, 0.0}
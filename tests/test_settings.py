@@ -11,6 +11,7 @@ Covers:
 
 from __future__ import annotations
 
+import unicodedata
 from pathlib import Path
 from types import ModuleType
 from collections.abc import Callable
@@ -75,6 +76,7 @@ def test_is_test_mode(monkeypatch: pytest.MonkeyPatch) -> None:
 
     monkeypatch.setenv("CHARFINDER_ENV", "DEV")
     monkeypatch.setenv("PYTEST_CURRENT_TEST", "yes")
+    settings.clear_settings_cache()
     assert not settings.is_test_mode()
 
 
@@ -107,6 +109,22 @@ def test_resolve_loaded_dotenv_paths(
     assert sett.resolve_loaded_dotenv_paths() == [dotenv]
 
 
+def test_load_settings_skips_dotenv_in_test_mode(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    dotenv = tmp_path / ".env"
+    dotenv.write_text("CHARFINDER_DOTENV_MARKER=1\n")
+    monkeypatch.delenv("CHARFINDER_DOTENV_MARKER", raising=False)
+    monkeypatch.setenv("DOTENV_PATH", str(dotenv))
+    monkeypatch.setenv("CHARFINDER_ENV", "TEST")
+    settings.clear_settings_cache()
+
+    assert settings.load_settings() == []
+
+    monkeypatch.setenv("CHARFINDER_FORCE_DOTENV", "1")
+    assert settings.load_settings() == [dotenv]
+
+
 # ---------------------------------------------------------------------
 # Safe int and config fallback
 # ---------------------------------------------------------------------
@@ -124,6 +142,17 @@ def test_safe_int(monkeypatch: pytest.MonkeyPatch, envval: str | None, default:
     assert settings.safe_int(key, default) == expected
 
 
+def test_environment_is_memoized_until_cleared(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("CHARFINDER_ENV", "UAT")
+    assert settings.get_environment() == "UAT"
+
+    monkeypatch.setenv("CHARFINDER_ENV", "PROD")
+    assert settings.get_environment() == "UAT"
+
+    settings.clear_settings_cache()
+    assert settings.get_environment() == "PROD"
+
+
 def test_get_log_defaults() -> None:
     assert isinstance(settings.get_log_max_bytes(), int)
     assert isinstance(settings.get_log_backup_count(), int)
@@ -147,16 +176,17 @@ def test_get_log_dir(temp_log_dir: Path) -> None:
 def test_get_cache_file(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.delenv("CHARFINDER_CACHE_FILE_PATH", raising=False)
     path = settings.get_cache_file()
-    assert path.name.endswith("unicode_name_cache.json")
+    assert path.name.endswith("unicode_name_cache.pkl")
 
 
 def test_get_unicode_data_file(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.delenv("CHARFINDER_UNICODE_DATA_FILE_PATH", raising=False)
     path = settings.get_unicode_data_file()
-    assert path.name == "UnicodeData.txt"
+    assert path.name == f"UnicodeData-{unicodedata.unidata_version}.txt"
 
 
 def test_get_unicode_data_url(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.delenv("UNICODE_DATA_URL", raising=False)
     url = settings.get_unicode_data_url()
     assert url.startswith("https://")
+    assert f"/{unicodedata.unidata_version}/" in url
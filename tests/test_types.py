@@ -3,9 +3,11 @@ Test types.py for structural correctness and compatibility.
 
 Covers:
 - FuzzyMatchContext and SearchConfig instantiation with valid literals
+- Immutability and slots of the context dataclasses
 - CharMatch TypedDict structure
 """
 
+import dataclasses
 from typing import get_type_hints
 
 import pytest
@@ -67,6 +69,22 @@ def test_search_config_fields() -> None:
     assert config.prefer_fuzzy is False
 
 
+def test_fuzzy_match_context_is_frozen_and_slotted() -> None:
+    ctx = types.FuzzyMatchContext(
+        threshold=0.8,
+        fuzzy_algo="sequencematcher",
+        match_mode="single",
+        agg_fn="mean",
+        verbose=False,
+        use_color=False,
+        query="test",
+    )
+
+    assert not hasattr(ctx, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        ctx.threshold = 0.5  # type: ignore[misc]
+
+
 @pytest.mark.parametrize(
     "data",
     [
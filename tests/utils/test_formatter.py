@@ -7,6 +7,7 @@ Covers formatting functions, color wrapping, and header/row formatting.
 # Imports
 # ---------------------------------------------------------------------
 
+import logging
 import sys
 from io import StringIO
 from types import SimpleNamespace
@@ -62,11 +63,25 @@ def test_should_use_color_never() -> None:
 def test_should_use_color_auto(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test 'auto' mode reflects sys.stdout.isatty()."""
     monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
+    F._invalidate_color_cache()
     assert F.should_use_color("auto") is True
     monkeypatch.setattr(sys.stdout, "isatty", lambda: False)
+    assert F.should_use_color("auto") is True
+    F._invalidate_color_cache()
     assert F.should_use_color("auto") is False
 
 
+def test_tty_cache_only_keeps_standard_streams() -> None:
+    """Other streams are asked directly; a closed one is not a terminal."""
+    F._invalidate_color_cache()
+    closed = StringIO()
+    closed.close()
+    assert F._stream_is_tty(closed) is False
+    assert F._stream_is_tty(StringIO()) is False
+    assert F._stream_is_tty(sys.stdout) is sys.stdout.isatty()
+    assert [entry[0] for entry in F._STD_STREAM_TTY.values()] == [sys.stdout]
+
+
 # ---------------------------------------------------------------------
 # format_result_line
 # ---------------------------------------------------------------------
@@ -124,6 +139,21 @@ def test_format_result_row_without_score() -> None:
     assert "0.988" not in row
 
 
+def test_format_result_rows_matches_format_result_row() -> None:
+    """Test batch formatting renders each row like format_result_row."""
+    rows = [(0x61, "a", "LATIN SMALL LETTER A", None), (0x1F600, "😀", "GRINNING FACE", 0.98765)]
+    assert F.format_result_rows(rows) == [F.format_result_row(*row) for row in rows]
+
+
+@pytest.mark.parametrize("has_score", [True, False])
+def test_result_row_formatter_matches_format_result_row(has_score: bool) -> None:
+    """Test the per-table formatter renders rows like format_result_row."""
+    format_row = F.result_row_formatter(has_score=has_score)
+    for score in ([0.98765, 1.0] if has_score else [None, 0.5]):
+        expected = F.format_result_row(0x61, "a", "LATIN SMALL LETTER A", score)
+        assert format_row(0x61, "a", "LATIN SMALL LETTER A", score) == expected
+
+
 # ---------------------------------------------------------------------
 # echo and log_optionally_echo (mocked)
 # ---------------------------------------------------------------------
@@ -132,8 +162,8 @@ def fake_logger() -> SimpleNamespace:
     """Create a fake logger with counters for method calls."""
     calls: dict[str, list[str]] = {}
 
-    def make_mock_method(name: str) -> Callable[[str], None]:
-        def mock(msg: str) -> None:
+    def make_mock_method(name: str) -> Callable[..., None]:
+        def mock(msg: str, **_kwargs: object) -> None:
             calls.setdefault(name, []).append(msg)
         return mock
 
@@ -143,6 +173,7 @@ def fake_logger() -> SimpleNamespace:
         warning=make_mock_method("warning"),
         error=make_mock_method("error"),
         exception=make_mock_method("exception"),
+        isEnabledFor=lambda level: True,
         _calls=calls,
     )
 
@@ -176,6 +207,33 @@ def test_echo_missing_log_method(monkeypatch: pytest.MonkeyPatch) -> None:
         F.echo("oops", str, log=True, log_method=None)
 
 
+def test_echo_lines_writes_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test echo_lines writes all styled lines with one flush and logs each."""
+    logger = fake_logger()
+    monkeypatch.setattr("charfinder.utils.logger_setup.get_logger", lambda: logger)
+    stream = StringIO()
+    flushes: list[None] = []
+    monkeypatch.setattr(stream, "flush", lambda: flushes.append(None))
+
+    F.echo_lines(["a", "b"], str.upper, stream=stream, log=True, log_method="debug")
+
+    assert stream.getvalue() == "A\nB\n"
+    assert len(flushes) == 1
+    assert logger._calls["debug"] == ["a", "b"]
+
+
+def test_echo_skips_disabled_levels(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test echo does not call the logger for a level it would discard."""
+    logger = fake_logger()
+    logger.isEnabledFor = lambda level: level >= logging.WARNING
+    monkeypatch.setattr("charfinder.utils.logger_setup.get_logger", lambda: logger)
+
+    F.echo("quiet", str, show=False, log=True, log_method="debug")
+    F.echo("loud", str, show=False, log=True, log_method="error")
+
+    assert logger._calls == {"error": ["loud"]}
+
+
 def test_log_optionally_echo_logs_only(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test log_optionally_echo logs but does not print when show=False."""
     logger = fake_logger()
@@ -30,18 +30,25 @@ from charfinder.utils import logger_helpers as lh
 
 def test_stream_filter_blocks_when_suppressed() -> None:
     """StreamFilter.filter returns False when suppression is active."""
-    lh._SUPPRESS_CONSOLE_OUTPUT.value = True
     filt = lh.StreamFilter()
     record = logging.LogRecord("name", logging.INFO, "", 0, "msg", None, None)
-    assert filt.filter(record) is False
+    with lh.suppress_console_logging():
+        assert filt.filter(record) is False
 
 def test_stream_filter_allows_when_not_suppressed() -> None:
     """StreamFilter.filter returns True when suppression is not active."""
-    lh._SUPPRESS_CONSOLE_OUTPUT.value = False
     filt = lh.StreamFilter()
     record = logging.LogRecord("name", logging.INFO, "", 0, "msg", None, None)
     assert filt.filter(record) is True
 
+def test_stream_filter_blocks_records_marked_suppressed() -> None:
+    """StreamFilter.filter returns False for records logged with CONSOLE_SUPPRESSED."""
+    logger = logging.getLogger("charfinder.test_stream_filter")
+    record = logger.makeRecord(
+        logger.name, logging.INFO, "", 0, "msg", (), None, extra=lh.CONSOLE_SUPPRESSED
+    )
+    assert lh.StreamFilter().filter(record) is False
+
 
 # ---------------------------------------------------------------------
 # suppress_console_logging Tests
@@ -49,10 +56,10 @@ def test_stream_filter_allows_when_not_suppressed() -> None:
 
 def test_suppress_console_logging_context_restores_flag() -> None:
     """Test suppression flag is set inside context and restored after."""
-    old_value = getattr(lh._SUPPRESS_CONSOLE_OUTPUT, "value", False)
+    old_value = lh._SUPPRESS_CONSOLE_OUTPUT.get()
     with lh.suppress_console_logging():
-        assert lh._SUPPRESS_CONSOLE_OUTPUT.value is True
-    assert lh._SUPPRESS_CONSOLE_OUTPUT.value == old_value
+        assert lh._SUPPRESS_CONSOLE_OUTPUT.get() is True
+    assert lh._SUPPRESS_CONSOLE_OUTPUT.get() == old_value
 
 
 # ---------------------------------------------------------------------
@@ -70,6 +77,15 @@ def test_environment_filter_sets_env(monkeypatch: pytest.MonkeyPatch) -> None:
     assert record.env == "TEST_ENV"
 
 
+def test_environment_filter_keeps_existing_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """EnvironmentFilter.filter leaves an already-set env untouched."""
+    record = logging.LogRecord("name", logging.INFO, "", 0, "msg", None, None)
+    record.__dict__["env"] = "PRESET"
+    monkeypatch.setattr("charfinder.settings.get_environment", lambda: "OTHER")
+    assert lh.EnvironmentFilter().filter(record) is True
+    assert record.__dict__["env"] == "PRESET"
+
+
 # ---------------------------------------------------------------------
 # SafeFormatter Tests
 # ---------------------------------------------------------------------
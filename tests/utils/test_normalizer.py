@@ -0,0 +1,42 @@
+"""
+Unit tests for normalizer.py in charfinder.utils.
+Covers the ASCII fast path against full Unicode normalization, and the
+memoization of non-ASCII input.
+"""
+
+# ---------------------------------------------------------------------
+# Imports
+# ---------------------------------------------------------------------
+
+import unicodedata
+
+import pytest
+
+from charfinder.constants import DEFAULT_NORMALIZATION_FORM
+from charfinder.utils import normalizer
+from charfinder.utils.normalizer import normalize
+
+# ---------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["latin small letter a", "SNOW-MAN 2", "", "café", "Å", "ﬁ ligature"],
+)
+def test_normalize_matches_full_path(text: str) -> None:
+    expected = unicodedata.normalize(DEFAULT_NORMALIZATION_FORM, text).upper()
+    assert normalize(text) == expected
+
+
+def test_normalize_memoizes_only_non_ascii_input() -> None:
+    normalizer.clear_normalize_cache()
+    cache_info = normalizer._normalize_non_ascii.cache_info
+
+    normalize("latin small letter a")
+    normalize("café")
+    normalize("café")
+
+    assert cache_info().hits == 1
+    assert cache_info().misses == 1